@@ -1,8 +1,26 @@
 """Core functionality for AI Writer."""
 
-from ai_writer.core.file_manager import FileManager
-from ai_writer.core.ollama_client import OllamaClient
-from ai_writer.core.prompt_manager import PromptManager, get_prompt_manager, initialize_default_prompts
-from ai_writer.core.spell_checker import SpellChecker
+import importlib
+
+# Exports are imported on first access, so Qt-free modules such as
+# ollama_api can be used without loading PyQt
+_EXPORTS = {
+    "OllamaClient": "ai_writer.core.ollama_client",
+    "FileManager": "ai_writer.core.file_manager",
+    "PromptManager": "ai_writer.core.prompt_manager",
+    "get_prompt_manager": "ai_writer.core.prompt_manager",
+    "initialize_default_prompts": "ai_writer.core.prompt_manager",
+    "SpellChecker": "ai_writer.core.spell_checker",
+}
 
 __all__ = ["OllamaClient", "FileManager", "PromptManager", "get_prompt_manager", "initialize_default_prompts", "SpellChecker"]
+
+
+def __getattr__(name: str):
+    """Import an exported name from its submodule on first use."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
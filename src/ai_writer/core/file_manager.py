@@ -4,20 +4,110 @@ This module handles file operations including saving documents in various
 formats and managing file paths.
 """
 
+import importlib.util
+import re
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
+from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtWidgets import QFileDialog, QMessageBox, QWidget
 
-# Try to import docx support
-try:
+from ai_writer.config import get_settings, save_settings
+from ai_writer.utils.workers import BackgroundWorker
+
+# Check for docx support without importing it; python-docx is only loaded
+# the first time a .docx file is read or written
+DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
+
+# Non-empty runs of text between newlines
+_LINE_RE = re.compile(r"[^\n]+")
+
+
+def write_txt(file_path: str, text: str) -> None:
+    """Write text to a UTF-8 encoded .txt file.
+
+    Args:
+        file_path: Destination path
+        text: Text content to write
+    """
+    data = memoryview(text.encode("utf-8"))
+    # Unbuffered so the encoded text goes to the kernel in one write call
+    # rather than being copied through an 8 KB buffer
+    with open(file_path, "wb", buffering=0) as f:
+        while data:
+            data = data[f.write(data):]
+
+
+def write_docx(file_path: str, text: str) -> None:
+    """Write text to a .docx file, one paragraph per non-empty line.
+
+    Args:
+        file_path: Destination path
+        text: Text content to write
+    """
     from docx import Document
 
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+    doc = Document()
+    doc.add_heading("AI Writer Document", 0)
+    doc.add_paragraph(f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    doc.add_paragraph()
 
-from ai_writer.config import get_settings, save_settings
+    # Walk non-empty lines in place; blank lines never become strings
+    for match in _LINE_RE.finditer(text):
+        para = match.group()
+        if not para.isspace():
+            doc.add_paragraph(para)
+
+    doc.save(file_path)
+
+
+def iter_paragraphs(file_path: str) -> Iterator[str]:
+    """Yield the text of each paragraph in a .docx file.
+
+    Args:
+        file_path: Path to the .docx file
+
+    Yields:
+        Paragraph text, in document order
+    """
+    from docx import Document
+
+    doc = Document(file_path)
+    for para in doc.paragraphs:
+        yield para.text
+
+
+class FileWriteWorker(BackgroundWorker):
+    """Background worker that writes a document to disk."""
+
+    # Signals
+    done = pyqtSignal(str)  # Saved file path
+    error = pyqtSignal(str)  # Error message
+
+    def __init__(self, file_path: str, text: str, fmt: str):
+        """Initialize the file write worker.
+
+        Args:
+            file_path: Destination path
+            text: Text content to write
+            fmt: File format, either "txt" or "docx"
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.text = text
+        self.fmt = fmt
+
+    def run(self) -> None:
+        """Write the file in the background."""
+        try:
+            if self.fmt == "docx":
+                write_docx(self.file_path, self.text)
+            else:
+                write_txt(self.file_path, self.text)
+            self.done.emit(self.file_path)
+        except Exception as e:
+            self.error.emit(f"Failed to save: {str(e)}")
 
 
 class FileManager:
@@ -53,8 +143,7 @@ class FileManager:
             return False
 
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(text)
+            write_txt(file_path, text)
             self.current_file = file_path
             self._update_last_save_folder(file_path)
             self._show_success(f"Saved to {file_path}")
@@ -90,19 +179,7 @@ class FileManager:
             return False
 
         try:
-
-            doc = Document() # type: ignore
-            doc.add_heading("AI Writer Document", 0)
-            doc.add_paragraph(f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-            doc.add_paragraph()
-
-            # Split into paragraphs and add to document
-            paragraphs = text.split("\n")
-            for para in paragraphs:
-                if para.strip():
-                    doc.add_paragraph(para)
-
-            doc.save(file_path)
+            write_docx(file_path, text)
             self.current_file = file_path
             self._update_last_save_folder(file_path)
             self._show_success(f"Saved to {file_path}")
@@ -111,6 +188,56 @@ class FileManager:
             self._show_error(f"Failed to save: {str(e)}")
             return False
 
+    def save_in_background(
+        self, text: str, fmt: str, file_path: str | None = None
+    ) -> FileWriteWorker | None:
+        """Prepare a background save of the text.
+
+        Validation and the save dialog run on the calling thread; only the
+        disk write happens in the returned worker.
+
+        Args:
+            text: Text content to save
+            fmt: File format, either "txt" or "docx"
+            file_path: Optional path to save to; if None, prompts user
+
+        Returns:
+            FileWriteWorker ready to start, or None if the save was aborted
+        """
+        if fmt == "docx" and not DOCX_AVAILABLE:
+            self._show_warning(
+                "python-docx not installed. Run: pip install python-docx"
+            )
+            return None
+
+        if not text.strip():
+            self._show_warning("No text to save!")
+            return None
+
+        if not file_path:
+            if fmt == "docx":
+                file_path = self._get_save_path("docx", "Word Documents (*.docx)")
+            else:
+                file_path = self._get_save_path("txt", "Text Files (*.txt)")
+
+        if not file_path:
+            return None
+
+        worker = FileWriteWorker(file_path, text, fmt)
+        worker.done.connect(self._on_background_save_done)
+        worker.error.connect(self._show_error)
+        return worker
+
+    def _on_background_save_done(self, file_path: str) -> None:
+        """Record a completed background save.
+
+        Args:
+            file_path: Path the document was saved to
+        """
+        self.current_file = file_path
+        self._update_last_save_folder(file_path)
+        self._show_success(f"Saved to {file_path}")
+
     def save_with_default_format(self, text: str) -> bool:
         """Save using the default format from settings.
 
@@ -141,11 +268,13 @@ class FileManager:
             path = Path(file_path)
 
             if path.suffix.lower() in [".txt", ".md"]:
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
+                # One sized binary read and a single decode pass
+                content = path.read_bytes().decode("utf-8")
+                if "\r" in content:
+                    # Match text mode's universal newline handling
+                    content = content.replace("\r\n", "\n").replace("\r", "\n")
             elif path.suffix.lower() == ".docx" and DOCX_AVAILABLE:
-                doc = Document(file_path) # type: ignore
-                content = "\n".join([para.text for para in doc.paragraphs])
+                content = "\n".join(iter_paragraphs(file_path))
             else:
                 self._show_error(f"Unsupported file format: {path.suffix}")
                 return None
@@ -0,0 +1,492 @@
+"""HTTP client for the Ollama API.
+
+This module talks to Ollama over plain HTTP and has no Qt dependency, so it
+can be imported without loading PyQt. The Qt workers that run these calls in
+the background live in ollama_client.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Generator, Iterable, Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Try to use orjson for faster encoding and parsing of Ollama's JSON
+_loads: Callable[[str | bytes], Any]
+_dumps: Callable[[object], bytes]
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _json_dumps(obj: object) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _dumps = _json_dumps
+
+# Request bodies are sent pre-encoded, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Ollama reuses its KV cache only when the prompt prefix is byte-identical
+# between requests, so the instruction must stay constant. Any dynamic content
+# (timestamps, character counts, model names) must go after the user text,
+# never before it.
+SYSTEM_INSTRUCTION = (
+    "Continue writing from where the text ends naturally. "
+    "Do not repeat what was already written. "
+    "Do not add explanations, comments, or meta-text. "
+    "Just continue the story or sentence seamlessly."
+)
+
+# Static start of every generation prompt; the user's text is appended to it
+_PROMPT_PREFIX = f"{SYSTEM_INSTRUCTION}\n\nText to complete:\n"
+
+# How long Ollama keeps the model (and its cache) loaded between requests
+KEEP_ALIVE = "60m"
+
+# Read size for streamed responses; Ollama sends chunked responses, so a read
+# returns as soon as a chunk arrives and never waits to fill the buffer
+STREAM_CHUNK_SIZE = 8192
+
+# Byte patterns identifying the final, text-less record of a stream
+_DONE_MARKER = b'"done":true'
+_EMPTY_RESPONSE_MARKER = b'"response":""'
+
+# Start of the text field in a compact streamed record
+_RESPONSE_MARKER = b'"response":"'
+
+# Connections kept open to the Ollama server; one per background pool thread
+# (see ai_writer.utils.workers.MAX_POOL_THREADS)
+MAX_CONNECTIONS = 4
+
+# Seconds a scanned model list is reused before the server is asked again
+MODELS_CACHE_TTL = 30.0
+
+# Last model list seen on each server, kept on disk so the UI can offer it
+# immediately at startup while a fresh scan runs
+MODELS_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "ai_writer"
+    / "models.json"
+)
+
+# Default number of trailing document characters sent as generation context
+DEFAULT_CONTEXT_CHARS = 4000
+
+# Common prefixes that models add before the actual continuation
+_CHATTER_PREFIXES = (
+    "here's the continuation:",
+    "here is the continuation:",
+    "here's the completion:",
+    "here is the completion:",
+    "the continuation is:",
+    "continuation:",
+    "continued:",
+    "completion:",
+)
+
+# Prefixes bucketed by (lowercase) first character, so a completion is only
+# compared against the few prefixes that could match it
+_PREFIX_BUCKETS: dict[str, list[tuple[str, int]]] = {}
+for _prefix in _CHATTER_PREFIXES:
+    _PREFIX_BUCKETS.setdefault(_prefix[0], []).append((_prefix, len(_prefix)))
+del _prefix
+
+# First characters that can start a chatter prefix or a stray opening quote
+_CLEANUP_FIRST_CHARS = frozenset(
+    "".join(_PREFIX_BUCKETS) + "".join(_PREFIX_BUCKETS).upper() + '"'
+)
+
+
+def trim_context(text: str, max_chars: int = DEFAULT_CONTEXT_CHARS) -> str:
+    """Limit text to its trailing max_chars characters.
+
+    The cut is moved back to the nearest paragraph break (within a quarter of
+    max_chars) so the start of the context stays the same while the user keeps
+    typing, which lets Ollama reuse its prompt cache.
+
+    Args:
+        text: Full document text
+        max_chars: Maximum context length to aim for
+
+    Returns:
+        The trailing part of the text to send as context
+    """
+    cut = len(text) - max_chars
+    if cut <= 0:
+        return text
+
+    boundary = text.rfind("\n\n", max(0, cut - max_chars // 4), cut)
+    if boundary >= 0:
+        cut = boundary + 2
+    return text[cut:]
+
+
+def _read_models_file() -> dict:
+    """Read the persisted model lists, or an empty dict if there are none."""
+    try:
+        data = _loads(MODELS_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def load_cached_models(url: str) -> list[str]:
+    """Get the model list last saved for an Ollama server.
+
+    Args:
+        url: Server URL
+
+    Returns:
+        Model names, or an empty list if none were saved
+    """
+    entry = _read_models_file().get(url)
+    models = entry.get("models") if isinstance(entry, dict) else None
+    return list(models) if isinstance(models, list) else []
+
+
+def save_cached_models(url: str, models: list[str]) -> None:
+    """Persist the model list of an Ollama server.
+
+    The file is only rewritten when the list changed. Write errors are
+    ignored, since the cache is only a startup convenience.
+
+    Args:
+        url: Server URL
+        models: Model names reported by the server
+    """
+    data = _read_models_file()
+    entry = data.get(url)
+    if isinstance(entry, dict) and entry.get("models") == models:
+        return
+    data[url] = {"models": list(models), "timestamp": time.time()}
+    try:
+        MODELS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        MODELS_CACHE_PATH.write_bytes(_dumps(data))
+    except OSError:
+        pass
+
+
+def _iter_records(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Split a stream of byte chunks into newline-delimited records.
+
+    Each chunk is scanned once with bytes.find; only a record split across
+    two chunks is ever copied to join it. Empty records are skipped.
+
+    Args:
+        chunks: Raw response body chunks
+
+    Yields:
+        One NDJSON record per line, without the newline
+    """
+    pending = b""
+    for chunk in chunks:
+        if pending:
+            chunk = pending + chunk
+        start = 0
+        while (end := chunk.find(b"\n", start)) >= 0:
+            if end > start:
+                yield chunk[start:end]
+            start = end + 1
+        pending = chunk[start:]
+    if pending:
+        yield pending
+
+
+def _parse_stream_line(line: bytes) -> tuple[str | None, bool]:
+    """Extract the text and done flag from one streamed NDJSON record.
+
+    Plain text without escapes is sliced straight out of the bytes, so the
+    common per-token record never builds a dict. Anything else falls back to
+    a full JSON parse.
+
+    Args:
+        line: One record of the /api/generate stream
+
+    Returns:
+        Tuple of (response text or None, done flag)
+    """
+    start = line.find(_RESPONSE_MARKER)
+    if start >= 0:
+        start += len(_RESPONSE_MARKER)
+        end = line.find(b'"', start)
+        if end >= 0 and line.find(b"\\", start, end) < 0:
+            return line[start:end].decode("utf-8"), _DONE_MARKER in line
+
+    data = _loads(line)
+    return data.get("response"), data.get("done", False)
+
+
+def _skip_whitespace(text: str, start: int) -> int:
+    """Return the index of the first non-whitespace character at or after start.
+
+    Args:
+        text: Text to scan
+        start: Index to start scanning from
+
+    Returns:
+        Index of the first non-whitespace character, or len(text)
+    """
+    end = len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    return start
+
+
+class OllamaAPI:
+    """Pure Python client for Ollama API operations."""
+
+    # Shared keep-alive session so every scan/generate reuses the same pooled
+    # connection to the Ollama server instead of paying a TCP handshake each time.
+    _session: requests.Session | None = None
+    _session_lock = threading.Lock()
+
+    # Recently scanned model lists, keyed by server URL
+    _models_cache: dict[str, tuple[float, list[str]]] = {}
+    _models_cache_lock = threading.Lock()
+
+    def __init__(
+        self, url: str, timeout: int = 10, session: requests.Session | None = None
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.session = session if session is not None else self.get_session()
+        self._active_response: requests.Response | None = None
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Get the shared HTTP session, creating it on first use."""
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                # Ollama speaks HTTP/1.1 only, so concurrent scan/generate
+                # requests each need their own connection; keep one warm per
+                # pool thread that can issue requests at the same time
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=MAX_CONNECTIONS,
+                    max_retries=0,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(
+                    {"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"}
+                )
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def close_session(cls) -> None:
+        """Close the shared HTTP session and release pooled connections."""
+        with cls._session_lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+
+    def close(self) -> None:
+        """Close the in-flight generation response, if any.
+
+        The shared session stays open so later requests keep reusing its
+        pooled connections.
+        """
+        response = self._active_response
+        if response is not None:
+            response.close()
+
+    def scan_models(self, force_refresh: bool = False) -> list[str]:
+        """Scan for available Ollama models.
+
+        Results are reused for MODELS_CACHE_TTL seconds, since installed models
+        rarely change during a session.
+
+        Args:
+            force_refresh: Always query the server, ignoring any cached list
+
+        Returns:
+            Names of the installed models
+        """
+        if not force_refresh:
+            with self._models_cache_lock:
+                cached = self._models_cache.get(self.url)
+            if cached and time.monotonic() - cached[0] < MODELS_CACHE_TTL:
+                return list(cached[1])
+
+        response = self.session.get(f"{self.url}/api/tags", timeout=self.timeout)
+        response.raise_for_status()
+        data = _loads(response.content)
+        models = [model["name"] for model in data.get("models", [])]
+
+        with self._models_cache_lock:
+            self._models_cache[self.url] = (time.monotonic(), models)
+        return list(models)
+
+    @classmethod
+    def clear_models_cache(cls) -> None:
+        """Forget all cached model lists."""
+        with cls._models_cache_lock:
+            cls._models_cache.clear()
+
+    @staticmethod
+    def _build_payload(
+        model: str, prompt: str, temperature: float, token_limit: int, stream: bool
+    ) -> dict:
+        """Build the /api/generate request body for a completion."""
+        return {
+            "model": model,
+            "prompt": _PROMPT_PREFIX + prompt,
+            "stream": stream,
+            "keep_alive": KEEP_ALIVE,
+            "options": {"num_predict": token_limit, "temperature": temperature},
+        }
+
+    def warm_up(self, model: str) -> None:
+        """Ask Ollama to load a model into memory without generating anything.
+
+        Ollama treats a generate request with an empty prompt as a load request,
+        so the first real generation does not pay the model load time.
+        """
+        payload = {"model": model, "prompt": "", "keep_alive": KEEP_ALIVE}
+        response = self.session.post(
+            f"{self.url}/api/generate",
+            data=_dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+
+    def generate_text_stream(
+        self,
+        model: str,
+        prompt: str,
+        temperature: float,
+        token_limit: int,
+    ) -> Generator[str, None, None]:
+        """Generate text as a stream of chunks."""
+        payload = self._build_payload(
+            model, prompt, temperature, token_limit, stream=True
+        )
+
+        response = self.session.post(
+            f"{self.url}/api/generate",
+            data=_dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=self.timeout,
+            stream=True
+        )
+        response.raise_for_status()
+        self._active_response = response
+
+        try:
+            is_first_chunk = True
+            # Local bindings avoid global lookups on every streamed line
+            parse_line = _parse_stream_line
+            done_marker = _DONE_MARKER
+            empty_marker = _EMPTY_RESPONSE_MARKER
+            for line in _iter_records(
+                response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            ):
+                # Ollama's final record has no text, only stats and a large
+                # context array; spot it on the raw bytes and skip parsing it
+                if done_marker in line and empty_marker in line:
+                    break
+
+                chunk, done = parse_line(line)
+
+                # Clean the first chunk if needed (remove model chatter)
+                if is_first_chunk and chunk:
+                    chunk = self.clean_completion(prompt, chunk)
+                    is_first_chunk = False
+
+                if chunk:
+                    yield chunk
+
+                if done:
+                    break
+        finally:
+            self._active_response = None
+            response.close()
+
+    def generate_text(
+        self,
+        model: str,
+        prompt: str,
+        temperature: float,
+        token_limit: int,
+    ) -> str:
+        """Generate complete text at once."""
+        payload = self._build_payload(
+            model, prompt, temperature, token_limit, stream=False
+        )
+
+        response = self.session.post(
+            f"{self.url}/api/generate",
+            data=_dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=self.timeout,
+            stream=False
+        )
+        response.raise_for_status()
+        
+        data = _loads(response.content)
+        completion = data.get("response", "")
+        return self.clean_completion(prompt, completion)
+
+    @staticmethod
+    def clean_completion(original: str, completion: str) -> str:
+        """Clean the completion text to remove unwanted artifacts."""
+        original_stripped = original.strip()
+        completion_stripped = completion.strip()
+
+        # Fast path: every cleanup below needs the completion to start with the
+        # prompt's first character, a chatter prefix (h/c/t) or a quote
+        if not completion_stripped:
+            return completion_stripped
+        first = completion_stripped[0]
+        if first not in _CLEANUP_FIRST_CHARS and (
+            not original_stripped or first != original_stripped[0]
+        ):
+            return completion_stripped
+
+        # Each rule below advances a start index instead of slicing, so the
+        # cleaned text is copied out once at the end
+        start = 0
+
+        # Skip the original text if it appears at the start of completion; the
+        # prompt can be thousands of characters, so cheap length and first
+        # character checks gate the full comparison
+        olen = len(original_stripped)
+        if (
+            olen
+            and len(completion_stripped) >= olen
+            and first == original_stripped[0]
+            and completion_stripped.startswith(original_stripped)
+        ):
+            start = _skip_whitespace(completion_stripped, olen)
+
+        # Skip common prefixes that the model might add; they can be chained,
+        # so look again after each one until nothing matches
+        matched = True
+        while matched:
+            matched = False
+            for prefix, plen in _PREFIX_BUCKETS.get(
+                completion_stripped[start:start + 1].lower(), ()
+            ):
+                if completion_stripped[start:start + plen].lower() == prefix:
+                    start = _skip_whitespace(completion_stripped, start + plen)
+                    matched = True
+                    break
+
+        # Handle quote matching
+        if completion_stripped.startswith('"', start) and not (
+            original_stripped.endswith('"')
+        ):
+            start = _skip_whitespace(completion_stripped, start + 1)
+
+        return completion_stripped[start:] if start else completion_stripped
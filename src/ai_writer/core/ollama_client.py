@@ -1,147 +1,51 @@
-"""Ollama API client and worker threads for AI Writer.
+"""Ollama worker threads and client for AI Writer.
 
-This module provides the interface to communicate with the Ollama API for
-model management and text generation.
+This module runs Ollama API calls from ollama_api in the background and
+reports the results through Qt signals.
 """
 
-import json
-from typing import Generator
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 
 import requests
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QThreadPool, pyqtSignal
 
 from ai_writer.config import get_settings
-
-
-class OllamaAPI:
-    """Pure Python client for Ollama API operations."""
-
-    def __init__(self, url: str, timeout: int = 10):
-        self.url = url
-        self.timeout = timeout
-
-    def scan_models(self) -> list[str]:
-        """Scan for available Ollama models."""
-        response = requests.get(f"{self.url}/api/tags", timeout=self.timeout)
-        response.raise_for_status()
-        data = response.json()
-        return [model["name"] for model in data.get("models", [])]
-
-    def generate_text_stream(
-        self,
-        model: str,
-        prompt: str,
-        temperature: float,
-        token_limit: int,
-    ) -> Generator[str, None, None]:
-        """Generate text as a stream of chunks."""
-        system_instruction = (
-            "Continue writing from where the text ends naturally. "
-            "Do not repeat what was already written. "
-            "Do not add explanations, comments, or meta-text. "
-            "Just continue the story or sentence seamlessly."
-        )
-        full_prompt = f"{system_instruction}\n\nText to complete:\n{prompt}"
-
-        payload = {
-            "model": model,
-            "prompt": full_prompt,
-            "stream": True,
-            "options": {"num_predict": token_limit, "temperature": temperature},
-        }
-
-        response = requests.post(
-            f"{self.url}/api/generate",
-            json=payload,
-            timeout=self.timeout,
-            stream=True
-        )
-        response.raise_for_status()
-
-        is_first_chunk = True
-        for line in response.iter_lines():
-            if line:
-                data = json.loads(line.decode("utf-8"))
-                chunk = data.get("response", "")
-                
-                # Clean the first chunk if needed (remove model chatter)
-                if is_first_chunk and chunk:
-                    chunk = self.clean_completion(prompt, chunk)
-                    is_first_chunk = False
-                
-                if chunk:
-                    yield chunk
-                    
-                if data.get("done"):
-                    break
-
-    def generate_text(
-        self,
-        model: str,
-        prompt: str,
-        temperature: float,
-        token_limit: int,
-    ) -> str:
-        """Generate complete text at once."""
-        system_instruction = (
-            "Continue writing from where the text ends naturally. "
-            "Do not repeat what was already written. "
-            "Do not add explanations, comments, or meta-text. "
-            "Just continue the story or sentence seamlessly."
-        )
-        full_prompt = f"{system_instruction}\n\nText to complete:\n{prompt}"
-
-        payload = {
-            "model": model,
-            "prompt": full_prompt,
-            "stream": False,
-            "options": {"num_predict": token_limit, "temperature": temperature},
-        }
-
-        response = requests.post(
-            f"{self.url}/api/generate",
-            json=payload,
-            timeout=self.timeout,
-            stream=False
-        )
-        response.raise_for_status()
-        
-        data = response.json()
-        completion = data.get("response", "")
-        return self.clean_completion(prompt, completion)
-
-    @staticmethod
-    def clean_completion(original: str, completion: str) -> str:
-        """Clean the completion text to remove unwanted artifacts."""
-        original_stripped = original.strip()
-        completion_stripped = completion.strip()
-
-        # Remove original text if it appears at the start of completion
-        if completion_stripped.startswith(original_stripped):
-            completion_stripped = completion_stripped[len(original_stripped) :].strip()
-
-        # Remove common prefixes that the model might add
-        prefixes = [
-            "here's the continuation:",
-            "continuation:",
-            "continued:",
-            "here is the completion:",
-            "here's the completion:",
-            "the continuation is:",
-            "completion:",
-        ]
-        for prefix in prefixes:
-            if completion_stripped.lower().startswith(prefix):
-                completion_stripped = completion_stripped[len(prefix) :].strip()
-
-        # Handle quote matching
-        if completion_stripped.startswith('"') and not original_stripped.endswith('"'):
-            completion_stripped = completion_stripped[1:].strip()
-
-        return completion_stripped
-
-
-class OllamaWorker(QThread):
+from ai_writer.core.ollama_api import OllamaAPI
+from ai_writer.utils.workers import BackgroundWorker
+
+# Streamed text is emitted to the UI once this many characters are buffered
+# or this many seconds have passed since the last emit. The check only runs
+# when a chunk arrives, so buffered text waits for the next token (or the end
+# of the stream) even if the interval has already passed
+STREAM_FLUSH_CHARS = 64
+STREAM_FLUSH_INTERVAL = 0.016
+
+# Completions kept for repeated identical requests; higher temperatures skip
+# the cache so sampling stays varied
+RESPONSE_CACHE_SIZE = 64
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.8
+
+# Warm-ups run one at a time on their own pool. Ollama answers a load request
+# only once the model is loaded, so a sent warm-up cannot be interrupted and
+# must not hold a slot of the shared pool meanwhile.
+_warmup_pool: QThreadPool | None = None
+_warmup_pool_lock = threading.Lock()
+
+
+def _get_warmup_pool() -> QThreadPool:
+    """Get the single-thread warm-up pool, creating it on first use."""
+    global _warmup_pool
+    with _warmup_pool_lock:
+        if _warmup_pool is None:
+            _warmup_pool = QThreadPool()
+            _warmup_pool.setMaxThreadCount(1)
+        return _warmup_pool
+
+
+class OllamaWorker(BackgroundWorker):
     """Background worker for communicating with Ollama API."""
 
     # Signals
@@ -151,6 +55,10 @@ class OllamaWorker(QThread):
 
     text_chunk_received = pyqtSignal(str)  # Real-time text chunks
 
+    # LRU cache of completions keyed by (model, temperature, token_limit, prompt)
+    _response_cache: OrderedDict[bytes, str] = OrderedDict()
+    _cache_lock = threading.Lock()
+
     def __init__(
         self,
         endpoint: str,
@@ -159,17 +67,19 @@ class OllamaWorker(QThread):
         temperature: float | None = None,
         token_limit: int | None = None,
         stream: bool = True,
+        force_refresh: bool = False,
     ):
         """Initialize the Ollama worker.
 
         Args:
-            endpoint: Either "scan" for model discovery or "generate" for
-                text generation
+            endpoint: "scan" for model discovery, "generate" for text
+                generation or "warmup" to preload a model
             model: Model name (required for generation)
             prompt: Input text (required for generation)
             temperature: Generation temperature (optional)
             token_limit: Maximum tokens to generate (optional)
             stream: Whether to stream the response (default: True)
+            force_refresh: Bypass the cached model list when scanning
         """
         super().__init__()
         self.endpoint = endpoint
@@ -178,18 +88,84 @@ class OllamaWorker(QThread):
         self.temperature = temperature
         self.token_limit = token_limit
         self.stream = stream
+        self.force_refresh = force_refresh
+        self._cancel_requested = False
+
+        # Resolve settings and the API client once, on the creating thread,
+        # so run() goes straight to the request
+        self._settings = get_settings()
+        self._api = OllamaAPI(
+            url=self._settings.ollama.url, timeout=self._settings.ollama.timeout
+        )
+
+    def start(self, pool: QThreadPool | None = None) -> None:
+        """Queue the worker, on the warm-up pool if it is a warm-up.
+
+        Args:
+            pool: Pool to run on (None picks the pool for the endpoint)
+        """
+        if pool is None and self.endpoint == "warmup":
+            pool = _get_warmup_pool()
+        super().start(pool)
+
+    def cancel(self) -> None:
+        """Request that an in-progress task stop as soon as possible.
+
+        A streaming generation is interrupted by closing its HTTP response.
+        """
+        self._cancel_requested = True
+        self._api.close()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether cancellation has been requested for this worker."""
+        return self._cancel_requested
+
+    @classmethod
+    def clear_response_cache(cls) -> None:
+        """Drop all cached completions."""
+        with cls._cache_lock:
+            cls._response_cache.clear()
+
+    @staticmethod
+    def _cache_key(
+        model: str, prompt: str, temperature: float, token_limit: int
+    ) -> bytes:
+        """Build the response cache key for a generation request."""
+        raw = f"{model}\0{temperature}\0{token_limit}\0{prompt}".encode()
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    @classmethod
+    def _get_cached(cls, key: bytes) -> str | None:
+        """Look up a cached completion, marking it most recently used."""
+        with cls._cache_lock:
+            completion = cls._response_cache.get(key)
+            if completion is not None:
+                cls._response_cache.move_to_end(key)
+            return completion
+
+    @classmethod
+    def _store_cached(cls, key: bytes, completion: str) -> None:
+        """Cache a completion, evicting the least recently used entry."""
+        with cls._cache_lock:
+            cls._response_cache[key] = completion
+            cls._response_cache.move_to_end(key)
+            while len(cls._response_cache) > RESPONSE_CACHE_SIZE:
+                cls._response_cache.popitem(last=False)
 
     def run(self) -> None:
         """Execute the background task."""
+        api = self._api
         try:
-            settings = get_settings()
-            api = OllamaAPI(url=settings.ollama.url, timeout=settings.ollama.timeout)
-            
             if self.endpoint == "scan":
-                models = api.scan_models()
+                models = api.scan_models(force_refresh=self.force_refresh)
                 self.models_loaded.emit(models)
             elif self.endpoint == "generate":
-                self._generate_text(api, settings)
+                self._generate_text(api, self._settings)
+            elif self.endpoint == "warmup":
+                # A warm-up cancelled while still queued is simply dropped
+                if self.model and not self._cancel_requested:
+                    api.warm_up(self.model)
         except requests.exceptions.ConnectionError:
             self.error.emit("Cannot connect to Ollama. Is it running?")
         except requests.exceptions.Timeout:
@@ -198,6 +174,8 @@ class OllamaWorker(QThread):
             self.error.emit(f"API Error: {e.response.status_code}")
         except Exception as e:
             self.error.emit(str(e))
+        finally:
+            api.close()
 
     def _generate_text(self, api: OllamaAPI, settings) -> None:
         """Generate text using the specified model."""
@@ -217,16 +195,65 @@ class OllamaWorker(QThread):
             else settings.generation.default_token_limit
         )
 
+        cache_key = None
+        if temperature <= RESPONSE_CACHE_MAX_TEMPERATURE:
+            cache_key = self._cache_key(
+                self.model, self.prompt, temperature, token_limit
+            )
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                if self.stream:
+                    self.text_chunk_received.emit(cached)
+                self.finished.emit(cached)
+                return
+
         if self.stream:
-            full_completion = ""
-            for chunk in api.generate_text_stream(
+            parts: list[str] = []
+            chunks = api.generate_text_stream(
                 model=self.model,
                 prompt=self.prompt,
                 temperature=temperature,
                 token_limit=token_limit
-            ):
-                full_completion += chunk
-                self.text_chunk_received.emit(chunk)
+            )
+            # Chunks are coalesced before being emitted so fast models do not
+            # flood the UI thread; the first chunk always goes out immediately
+            pending: list[str] = []
+            pending_chars = 0
+            last_flush = float("-inf")
+            try:
+                for chunk in chunks:
+                    if self._cancel_requested:
+                        # Closing the stream drops the HTTP response early
+                        chunks.close()
+                        break
+                    pending.append(chunk)
+                    pending_chars += len(chunk)
+
+                    now = time.monotonic()
+                    if (
+                        pending_chars >= STREAM_FLUSH_CHARS
+                        or now - last_flush >= STREAM_FLUSH_INTERVAL
+                    ):
+                        # The full completion is built from emitted batches,
+                        # so it holds a handful of strings rather than one
+                        # per token
+                        batch = "".join(pending)
+                        parts.append(batch)
+                        self.text_chunk_received.emit(batch)
+                        pending.clear()
+                        pending_chars = 0
+                        last_flush = now
+            except Exception:
+                # Aborting the response mid-read surfaces as a read error
+                if not self._cancel_requested:
+                    raise
+            if pending:
+                batch = "".join(pending)
+                parts.append(batch)
+                self.text_chunk_received.emit(batch)
+            full_completion = "".join(parts)
+            if cache_key is not None and not self._cancel_requested:
+                self._store_cached(cache_key, full_completion)
             self.finished.emit(full_completion)
         else:
             completion = api.generate_text(
@@ -235,6 +262,8 @@ class OllamaWorker(QThread):
                 temperature=temperature,
                 token_limit=token_limit
             )
+            if cache_key is not None:
+                self._store_cached(cache_key, completion)
             self.finished.emit(completion)
 
 
@@ -242,9 +271,31 @@ class OllamaClient:
     """High-level client for Ollama operations."""
 
     @staticmethod
-    def scan_models() -> OllamaWorker:
-        """Create a worker to scan for available models."""
-        return OllamaWorker(endpoint="scan")
+    def shutdown() -> None:
+        """Release the pooled HTTP connections held by the API layer."""
+        OllamaAPI.close_session()
+
+    @staticmethod
+    def invalidate_model_cache() -> None:
+        """Make the next model scan query the server again."""
+        OllamaAPI.clear_models_cache()
+
+    @staticmethod
+    def scan_models(force_refresh: bool = False) -> OllamaWorker:
+        """Create a worker to scan for available models.
+
+        Args:
+            force_refresh: Query the server even if a recent list is cached
+
+        Returns:
+            OllamaWorker instance ready to start
+        """
+        return OllamaWorker(endpoint="scan", force_refresh=force_refresh)
+
+    @staticmethod
+    def warm_up_model(model: str) -> OllamaWorker:
+        """Create a worker that preloads a model so the first generation is fast."""
+        return OllamaWorker(endpoint="warmup", model=model)
 
     @staticmethod
     def generate_text(
@@ -4,7 +4,8 @@ This module provides high-level functions for managing prompt templates,
 including CRUD operations and filtering by language model.
 """
 
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
 from ai_writer.config import get_settings, save_settings
 from ai_writer.config.settings import Prompt
@@ -16,6 +17,36 @@ class PromptManager:
     def __init__(self):
         """Initialize the prompt manager."""
         self.settings = get_settings()
+        self._store = self.settings.prompts
+        # Prompts compatible with each model, filled on demand and dropped
+        # whenever the prompt list changes
+        self._by_model: Dict[str, List[Prompt]] = {}
+        # Nesting depth of batch() blocks and whether they have unsaved changes
+        self._batch_depth = 0
+        self._dirty = False
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several changes into a single settings write.
+
+        Changes made inside the block are saved once when the outermost
+        block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                save_settings()
+
+    def _mark_dirty(self) -> None:
+        """Save settings now, or at the end of the current batch."""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            save_settings()
     
     def create_prompt(
         self, 
@@ -36,8 +67,9 @@ class PromptManager:
             The created Prompt object
         """
         prompt = Prompt.create(name, content, language_model, description)
-        self.settings.prompts.add_prompt(prompt)
-        save_settings()
+        self._store.add_prompt(prompt)
+        self._by_model.clear()
+        self._mark_dirty()
         return prompt
     
     def get_prompt(self, prompt_id: str) -> Optional[Prompt]:
@@ -49,7 +81,7 @@ class PromptManager:
         Returns:
             Prompt object if found, None otherwise
         """
-        return self.settings.prompts.get_prompt(prompt_id)
+        return self._store.get_prompt(prompt_id)
     
     def get_all_prompts(self) -> List[Prompt]:
         """Get all stored prompts.
@@ -57,7 +89,7 @@ class PromptManager:
         Returns:
             List of all prompts
         """
-        return self.settings.prompts.prompts
+        return self._store.prompts
     
     def get_prompts_for_model(self, model: str) -> List[Prompt]:
         """Get prompts compatible with a specific model.
@@ -68,7 +100,12 @@ class PromptManager:
         Returns:
             List of compatible prompts
         """
-        return self.settings.prompts.get_prompts_for_model(model)
+        prompts = self._by_model.get(model)
+        if prompts is None:
+            prompts = self._store.get_prompts_for_model(model)
+            self._by_model[model] = prompts
+        # A copy, so callers cannot change the memoized list
+        return list(prompts)
     
     def update_prompt(
         self, 
@@ -98,12 +135,13 @@ class PromptManager:
             prompt.name = name
         if content is not None:
             prompt.content = content
-        if language_model is not None:
+        if language_model is not None and language_model != prompt.language_model:
             prompt.language_model = language_model
+            self._by_model.clear()
         if description is not None:
             prompt.description = description
             
-        save_settings()
+        self._mark_dirty()
         return True
     
     def delete_prompt(self, prompt_id: str) -> bool:
@@ -115,9 +153,10 @@ class PromptManager:
         Returns:
             True if deleted, False if not found
         """
-        result = self.settings.prompts.remove_prompt(prompt_id)
+        result = self._store.remove_prompt(prompt_id)
         if result:
-            save_settings()
+            self._by_model.clear()
+            self._mark_dirty()
         return result
     
     def get_selected_prompt(self) -> Optional[Prompt]:
@@ -126,9 +165,9 @@ class PromptManager:
         Returns:
             Selected prompt or None
         """
-        if not self.settings.prompts.selected_prompt_id:
+        if not self._store.selected_prompt_id:
             return None
-        return self.get_prompt(self.settings.prompts.selected_prompt_id)
+        return self.get_prompt(self._store.selected_prompt_id)
     
     def set_selected_prompt(self, prompt_id: Optional[str]) -> bool:
         """Set the currently selected prompt.
@@ -142,8 +181,8 @@ class PromptManager:
         if prompt_id is not None and not self.get_prompt(prompt_id):
             return False
             
-        self.settings.prompts.selected_prompt_id = prompt_id
-        save_settings()
+        self._store.selected_prompt_id = prompt_id
+        self._mark_dirty()
         return True
     
     def get_prompt_names(self, model: Optional[str] = None) -> List[tuple[str, str]]:
@@ -194,12 +233,15 @@ class PromptManager:
             }
         ]
         
-        for prompt_data in default_prompts:
-            self.create_prompt(**prompt_data)
+        with self.batch():
+            for prompt_data in default_prompts:
+                self.create_prompt(**prompt_data)
 
 
 # Global prompt manager instance
 _prompt_manager: Optional[PromptManager] = None
+# Whether initialize_default_prompts() already ran in this process
+_defaults_initialized = False
 
 
 def get_prompt_manager() -> PromptManager:
@@ -211,6 +253,13 @@ def get_prompt_manager() -> PromptManager:
 
 
 def initialize_default_prompts() -> None:
-    """Initialize default prompts if none exist."""
-    manager = get_prompt_manager()
-    manager.create_default_prompts()
\ No newline at end of file
+    """Initialize default prompts if none exist.
+
+    Only the first call does any work, so prompt consumers can call it
+    before they first read the prompt list.
+    """
+    global _defaults_initialized
+    if _defaults_initialized:
+        return
+    _defaults_initialized = True
+    get_prompt_manager().create_default_prompts()
\ No newline at end of file
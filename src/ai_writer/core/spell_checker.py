@@ -1,6 +1,8 @@
 """Spell checking functionality for AI Writer."""
 
 import re
+import threading
+from collections import OrderedDict
 
 # Try to import enchant for spell checking
 try:
@@ -9,27 +11,156 @@ try:
 except ImportError:
     ENCHANT_AVAILABLE = False
 
-from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 from PyQt5.QtGui import QColor, QTextCharFormat, QTextCursor, QTextDocument
 from PyQt5.QtWidgets import QTextEdit
 
+from ai_writer.utils.workers import BackgroundWorker
 
-class SpellCheckWorker(QThread):
-    """Background thread for spell checking text."""
+# Delay after the last edit before the document is re-checked
+SPELL_CHECK_DELAY_MS = 400
 
-    word_checked = pyqtSignal(int, int, bool, list)  # start, length, is_correct, suggestions
+# Number of words whose dictionary lookup result is remembered
+CHECK_CACHE_SIZE = 50_000
+
+# Number of misspelled words whose suggestions are remembered
+SUGGEST_CACHE_SIZE = 2048
+
+# Words sent to the dictionary, and runs of letters around a position
+_WORD_RE = re.compile(r"\b[a-zA-Z]+\b")
+_LETTERS_RE = re.compile(r"[^\W\d_]*")
+_LETTERS_TAIL_RE = re.compile(r"[^\W\d_]+\Z")
+
+# Results of dictionary lookups, shared by all workers. Natural text repeats
+# the same words constantly, so most lookups never reach enchant.
+_CHECK_CACHE: OrderedDict[tuple[str, str], bool] = OrderedDict()
+_SUGGEST_CACHE: OrderedDict[tuple[str, str], list[str]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Loaded dictionaries by tag; loading one reads its word lists from disk
+_DICT_CACHE: dict[str, "_SharedDictionary"] = {}
+_dict_lock = threading.Lock()
+
+# Result of enchant.list_dicts(), which probes every installed provider
+_available_languages: list | None = None
+
+
+class _SharedDictionary:
+    """Enchant dictionary that can be used from several worker threads.
+
+    The underlying spell checker handle is not thread-safe, and a stopped
+    worker may still be running when its replacement starts, so every call
+    into it holds the dictionary's lock.
+    """
+
+    def __init__(self, dictionary_tag: str):
+        """Load the dictionary.
+
+        Args:
+            dictionary_tag: Language dictionary tag
+        """
+        self._dictionary = enchant.Dict(dictionary_tag)
+        self._lock = threading.Lock()
+
+    def check(self, word: str) -> bool:
+        """Check whether a word is spelled correctly."""
+        with self._lock:
+            return self._dictionary.check(word)
+
+    def suggest(self, word: str) -> list[str]:
+        """Get replacement suggestions for a word."""
+        with self._lock:
+            return self._dictionary.suggest(word)
+
+
+def _get_dictionary(dictionary_tag: str) -> _SharedDictionary:
+    """Get the dictionary for a tag, loading it on first use.
+
+    Args:
+        dictionary_tag: Language dictionary tag
+
+    Returns:
+        Shared dictionary for the tag
+    """
+    with _dict_lock:
+        dictionary = _DICT_CACHE.get(dictionary_tag)
+        if dictionary is None:
+            dictionary = _DICT_CACHE[dictionary_tag] = _SharedDictionary(
+                dictionary_tag
+            )
+        return dictionary
+
+
+def _is_correct(dictionary, dictionary_tag: str, word: str) -> bool:
+    """Check a word's spelling, using the shared LRU cache.
+
+    Args:
+        dictionary: Enchant dictionary to ask on a cache miss
+        dictionary_tag: Tag of that dictionary
+        word: Word to check
+
+    Returns:
+        True if the word is spelled correctly
+    """
+    key = (dictionary_tag, word)
+    with _cache_lock:
+        is_correct = _CHECK_CACHE.get(key)
+        if is_correct is not None:
+            _CHECK_CACHE.move_to_end(key)
+            return is_correct
+
+    is_correct = dictionary.check(word)
+    with _cache_lock:
+        _CHECK_CACHE[key] = is_correct
+        while len(_CHECK_CACHE) > CHECK_CACHE_SIZE:
+            _CHECK_CACHE.popitem(last=False)
+    return is_correct
+
+
+def _suggest(dictionary, dictionary_tag: str, word: str) -> list[str]:
+    """Get up to five suggestions for a word, using the shared LRU cache.
+
+    Args:
+        dictionary: Enchant dictionary to ask on a cache miss
+        dictionary_tag: Tag of that dictionary
+        word: Misspelled word
+
+    Returns:
+        Suggested replacements
+    """
+    key = (dictionary_tag, word)
+    with _cache_lock:
+        suggestions = _SUGGEST_CACHE.get(key)
+        if suggestions is not None:
+            _SUGGEST_CACHE.move_to_end(key)
+            return suggestions
+
+    suggestions = dictionary.suggest(word)[:5]  # Limit to 5 suggestions
+    with _cache_lock:
+        _SUGGEST_CACHE[key] = suggestions
+        while len(_SUGGEST_CACHE) > SUGGEST_CACHE_SIZE:
+            _SUGGEST_CACHE.popitem(last=False)
+    return suggestions
+
+
+class SpellCheckWorker(BackgroundWorker):
+    """Background task for spell checking text."""
+
+    misspellings_found = pyqtSignal(list)  # [(start, length, suggestions), ...]
     checking_finished = pyqtSignal()
 
-    def __init__(self, text: str, dictionary_tag: str = "en_US"):
+    def __init__(self, text: str, dictionary_tag: str = "en_US", offset: int = 0):
         """Initialize the spell check worker.
 
         Args:
             text: Text to spell check
             dictionary_tag: Language dictionary to use
+            offset: Document position of the first character of text
         """
         super().__init__()
         self.text = text
         self.dictionary_tag = dictionary_tag
+        self.offset = offset
         self._should_stop = False
 
     def run(self):
@@ -38,30 +169,21 @@ class SpellCheckWorker(QThread):
             return
 
         try:
-            # Initialize dictionary
-            dictionary = enchant.Dict(self.dictionary_tag)
+            dictionary = _get_dictionary(self.dictionary_tag)
 
-            # Find all words with their positions
-            word_pattern = re.compile(r'\b[a-zA-Z]+\b')
-
-            for match in word_pattern.finditer(self.text):
+            # Only misspellings are collected, and they are sent in one signal
+            results = []
+            for match in _WORD_RE.finditer(self.text):
                 if self._should_stop:
-                    break
+                    return
 
                 word = match.group()
-                start = match.start()
-                length = len(word)
-
-                # Check if word is correct
-                is_correct = dictionary.check(word)
+                if not _is_correct(dictionary, self.dictionary_tag, word):
+                    suggestions = _suggest(dictionary, self.dictionary_tag, word)
+                    start = match.start() + self.offset
+                    results.append((start, len(word), suggestions))
 
-                # Get suggestions if word is incorrect
-                suggestions = []
-                if not is_correct:
-                    suggestions = dictionary.suggest(word)[:5]  # Limit to 5 suggestions
-
-                # Emit result
-                self.word_checked.emit(start, length, is_correct, suggestions)
+            self.misspellings_found.emit(results)
 
         except Exception as e:
             print(f"Spell check error: {e}")
@@ -95,12 +217,43 @@ class SpellChecker(QObject):
         # Worker thread
         self.worker = None
 
+        # Range edited since the last check, in current document positions;
+        # only the paragraphs it touches are re-checked
+        self._dirty_range: tuple[int, int] | None = None
+        self._needs_full_check = True
+        self._worker_range: tuple[int, int] | None = None  # None = whole document
+        self._worker_done = True
+
+        # (text hash, dictionary tag) of the last completed full check, and
+        # the hash of the text a running full check was started on; cleared
+        # as soon as the document is edited
+        self._last_checked: tuple[int, str] | None = None
+        self._worker_hash: int | None = None
+
         # Format for highlighting misspelled words
         self.misspelled_format = QTextCharFormat()
         self.misspelled_format.setUnderlineColor(QColor(255, 0, 0))
         self.misspelled_format.setUnderlineStyle(QTextCharFormat.SpellCheckUnderline)
 
+        # Format that removes the misspelling underline again
+        self._clear_format = QTextCharFormat()
+        self._clear_format.setUnderlineStyle(QTextCharFormat.NoUnderline)
+
+        # (start, length) of every range currently underlined in the document
+        self._applied: set[tuple[int, int]] = set()
+
+        # Set while highlights are being applied, since format changes also
+        # emit textChanged and must not trigger another check
+        self._updating_highlights = False
+
+        # Re-check only once typing pauses
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(SPELL_CHECK_DELAY_MS)
+        self._debounce.timeout.connect(self.check_spelling)
+
         # Connect to text changes
+        self.text_editor.document().contentsChange.connect(self._on_contents_change)
         self.text_editor.textChanged.connect(self._on_text_changed)
 
     def set_enabled(self, enabled: bool):
@@ -113,7 +266,7 @@ class SpellChecker(QObject):
         if not enabled:
             self.clear_highlights()
         else:
-            self.check_spelling()
+            self.check_spelling(full=True)
 
     def set_dictionary(self, dictionary_tag: str):
         """Set the spell check dictionary language.
@@ -124,7 +277,7 @@ class SpellChecker(QObject):
         if ENCHANT_AVAILABLE and enchant.dict_exists(dictionary_tag):
             self.dictionary_tag = dictionary_tag
             if self.enabled:
-                self.check_spelling()
+                self.check_spelling(full=True)
         else:
             print(f"Dictionary '{dictionary_tag}' not available")
 
@@ -137,67 +290,178 @@ class SpellChecker(QObject):
         self.highlight_color = color
         self.misspelled_format.setUnderlineColor(color)
         if self.enabled:
+            # Every existing underline needs the new color
+            self._applied.clear()
             self.apply_highlights()
 
-    def check_spelling(self):
-        """Start spell checking the current text."""
+    def check_spelling(self, full: bool = False):
+        """Start spell checking the current text.
+
+        Only the paragraphs edited since the last check are re-checked, unless
+        a full check is requested or no full check has completed yet.
+
+        Args:
+            full: Re-check the whole document
+        """
+        self._debounce.stop()
         if not ENCHANT_AVAILABLE or not self.enabled:
             return
 
-        # Stop any existing worker
-        if self.worker and self.worker.isRunning():
-            self.worker.stop()
-            self.worker.wait()
+        # Stop any existing worker; its range still needs checking
+        self._stop_worker()
+
+        document = self.text_editor.document()
+        if full or self._needs_full_check or self._dirty_range is None:
+            text = self.text_editor.toPlainText()
+            text_hash = hash(text)
+            # Nothing changed since the last full check, so its results and
+            # underlines are still current
+            if self._last_checked == (text_hash, self.dictionary_tag):
+                return
+
+            self._needs_full_check = False
+            self._dirty_range = None
+            self.misspelled_words.clear()
+            if not text.strip():
+                return
+            self._start_worker(text, 0, None)
+            self._worker_hash = text_hash
+            return
 
-        # Clear existing highlights
-        self.misspelled_words.clear()
+        # Expand the edited range to whole paragraphs
+        start, end = self._dirty_range
+        self._dirty_range = None
+        end = min(end, document.characterCount() - 1)
+        first_block = document.findBlock(start)
+        last_block = document.findBlock(end)
+        block_start = first_block.position()
+        block_end = last_block.position() + last_block.length() - 1
+
+        self.misspelled_words = {
+            pos: entry
+            for pos, entry in self.misspelled_words.items()
+            if pos + entry[0] <= block_start or pos >= block_end
+        }
+
+        cursor = QTextCursor(document)
+        cursor.setPosition(block_start)
+        cursor.setPosition(block_end, QTextCursor.KeepAnchor)
+        # Paragraph separators come back as U+2029, which keeps offsets intact
+        self._start_worker(cursor.selectedText(), block_start, (block_start, block_end))
+
+    def _start_worker(
+        self, text: str, offset: int, check_range: tuple[int, int] | None
+    ):
+        """Start a worker for a piece of the document.
 
-        # Start new spell check
-        text = self.text_editor.toPlainText()
-        if text.strip():
-            self.worker = SpellCheckWorker(text, self.dictionary_tag)
-            self.worker.word_checked.connect(self._on_word_checked)
-            self.worker.checking_finished.connect(self._on_checking_finished)
-            self.worker.start()
+        Args:
+            text: Text to check
+            offset: Document position of the start of text
+            check_range: Document range covered, or None for the whole document
+        """
+        self._worker_range = check_range
+        self._worker_done = False
+        self._worker_hash = None
+        self.worker = SpellCheckWorker(text, self.dictionary_tag, offset)
+        self.worker.misspellings_found.connect(self._on_misspellings_found)
+        self.worker.checking_finished.connect(self._on_checking_finished)
+        self.worker.start()
+
+    def _stop_worker(self):
+        """Stop the current worker and requeue its range if unfinished.
+
+        The worker is not waited for, since it may still be queued behind
+        other pool tasks; anything it reports afterwards is ignored because
+        it is no longer the current worker.
+        """
+        worker = self.worker
+        if worker is None:
+            return
+        self.worker = None
+        worker.stop()
+        if not self._worker_done:
+            self._worker_done = True
+            if self._worker_range is None:
+                self._needs_full_check = True
+            else:
+                self._mark_dirty(*self._worker_range)
+
+    def _mark_dirty(self, start: int, end: int):
+        """Add a document range to the pending re-check range.
+
+        Args:
+            start: First position of the range
+            end: Position just past the range
+        """
+        if self._dirty_range is not None:
+            start = min(start, self._dirty_range[0])
+            end = max(end, self._dirty_range[1])
+        self._dirty_range = (start, end)
 
     def clear_highlights(self):
         """Clear all spell check highlights."""
+        self._debounce.stop()
         self.misspelled_words.clear()
+        self._applied.clear()
+        self._needs_full_check = True
+        self._last_checked = None
 
-        # Remove highlighting from text editor
-        cursor = self.text_editor.textCursor()
-        cursor.select(QTextCursor.Document)
-
-        # Reset format
-        format = QTextCharFormat()
-        cursor.mergeCharFormat(format)
-
-        # Clear selection
-        cursor.clearSelection()
-        self.text_editor.setTextCursor(cursor)
+        # Clear the whole document, since typing next to a misspelled word
+        # can extend its underline beyond the tracked ranges
+        self._clear_range(0, self.text_editor.document().characterCount() - 1)
 
     def apply_highlights(self):
-        """Apply highlights to all misspelled words."""
+        """Underline misspelled words, touching only ranges that changed."""
         if not self.enabled:
             return
 
-        # Save current cursor position
-        current_cursor = self.text_editor.textCursor()
-        current_position = current_cursor.position()
+        wanted = {
+            (position, length)
+            for position, (length, suggestions) in self.misspelled_words.items()
+        }
+        stale = self._applied - wanted
+        missing = wanted - self._applied
+        if not stale and not missing:
+            return
 
-        # Apply highlights
-        for position, (length, suggestions) in self.misspelled_words.items():
-            cursor = QTextCursor(self.text_editor.document())
-            cursor.setPosition(position)
-            cursor.setPosition(position + length, QTextCursor.KeepAnchor)
-            cursor.mergeCharFormat(self.misspelled_format)
+        document = self.text_editor.document()
+        self._updating_highlights = True
+        try:
+            cursor = QTextCursor(document)
+            # One edit block means a single relayout for all format changes
+            cursor.beginEditBlock()
+            for position, length in stale:
+                cursor.setPosition(position)
+                cursor.setPosition(position + length, QTextCursor.KeepAnchor)
+                cursor.mergeCharFormat(self._clear_format)
+            for position, length in missing:
+                cursor.setPosition(position)
+                cursor.setPosition(position + length, QTextCursor.KeepAnchor)
+                cursor.mergeCharFormat(self.misspelled_format)
+            cursor.endEditBlock()
+        finally:
+            self._updating_highlights = False
+        self._applied = wanted
+
+    def _clear_range(self, start: int, end: int):
+        """Remove the misspelling underline over a document range.
 
-        # Restore cursor position
-        cursor = QTextCursor(self.text_editor.document())
-        cursor.setPosition(current_position)
-        self.text_editor.setTextCursor(cursor)
+        Args:
+            start: First position of the range
+            end: Position just past the range
+        """
+        if end <= start:
+            return
+        self._updating_highlights = True
+        try:
+            cursor = QTextCursor(self.text_editor.document())
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            cursor.mergeCharFormat(self._clear_format)
+        finally:
+            self._updating_highlights = False
 
-    def get_word_at_position(self, position: int) -> Tuple[str, int, int]:
+    def get_word_at_position(self, position: int) -> tuple[str, int, int]:
         """Get the word at the specified position.
 
         Args:
@@ -206,21 +470,23 @@ class SpellChecker(QObject):
         Returns:
             Tuple of (word, start_position, length)
         """
-        text = self.text_editor.toPlainText()
+        # Words never span paragraphs, so only the enclosing block is needed
+        block = self.text_editor.document().findBlock(position)
+        if not block.isValid():
+            return "", position, 0
+        text = block.text()
+        block_start = block.position()
+        offset = position - block_start
 
         # Find word boundaries
-        start = position
-        while start > 0 and text[start - 1].isalpha():
-            start -= 1
-
-        end = position
-        while end < len(text) and text[end].isalpha():
-            end += 1
+        before = _LETTERS_TAIL_RE.search(text, 0, offset)
+        start = before.start() if before else offset
+        end = _LETTERS_RE.match(text, offset).end()
 
         word = text[start:end]
-        return word, start, end - start
+        return word, block_start + start, end - start
     
-    def get_suggestions_for_position(self, position: int) -> List[str]:
+    def get_suggestions_for_position(self, position: int) -> list[str]:
         """Get spell check suggestions for word at position.
         
         Args:
@@ -277,29 +543,97 @@ class SpellChecker(QObject):
             except Exception as e:
                 print(f"Error adding word to dictionary: {e}")
     
+    def _on_contents_change(self, position: int, chars_removed: int, chars_added: int):
+        """Track edited ranges and shift known misspellings past them.
+
+        Args:
+            position: Where the edit happened
+            chars_removed: Number of characters removed
+            chars_added: Number of characters inserted
+        """
+        if self._updating_highlights:
+            return
+
+        # Results from a worker started before this edit would be misplaced
+        self._stop_worker()
+        self._last_checked = None
+
+        removed_end = position + chars_removed
+        delta = chars_added - chars_removed
+
+        def shift(pos: int) -> int:
+            if pos <= position:
+                return pos
+            if pos >= removed_end:
+                return pos + delta
+            return position + chars_added
+
+        if self._dirty_range is not None:
+            self._dirty_range = (
+                shift(self._dirty_range[0]),
+                shift(self._dirty_range[1]),
+            )
+        self._mark_dirty(position, position + chars_added)
+
+        if self.misspelled_words:
+            self.misspelled_words = {
+                (pos if pos < position else pos + delta): entry
+                for pos, entry in self.misspelled_words.items()
+                if pos + entry[0] < position or pos >= removed_end
+            }
+
+        if self._applied:
+            # Underlines move with the text; ones hit by the edit are cleared
+            # with the rest of their paragraph when it is re-checked
+            self._applied = {
+                (pos if pos < position else pos + delta, length)
+                for pos, length in self._applied
+                if pos + length < position or pos >= removed_end
+            }
+
     def _on_text_changed(self):
         """Handle text editor content changes."""
-        if self.enabled:
-            # Debounce spell checking to avoid checking on every keystroke
-            # This would be better with a QTimer for proper debouncing
-            self.check_spelling()
+        if self.enabled and not self._updating_highlights:
+            # Restarting the timer pushes the check back until typing pauses
+            self._debounce.start()
     
-    def _on_word_checked(self, start: int, length: int, is_correct: bool, suggestions: List[str]):
-        """Handle word check result from worker thread.
-        
+    def _on_misspellings_found(self, results: list):
+        """Store the misspellings reported by the worker thread.
+
         Args:
-            start: Start position of the word
-            length: Length of the word
-            is_correct: Whether the word is spelled correctly
-            suggestions: List of spelling suggestions
+            results: List of (start, length, suggestions) tuples
         """
-        if not is_correct:
-            self.misspelled_words[start] = (length, suggestions)
-    
+        # Ignore results still queued from a worker that has been replaced
+        if self.sender() is not self.worker:
+            return
+        # Only a run that got through the whole text reports its results
+        if self._worker_hash is not None and self.enabled:
+            self._last_checked = (self._worker_hash, self.worker.dictionary_tag)
+        self.misspelled_words.update(
+            (start, (length, suggestions)) for start, length, suggestions in results
+        )
+
     def _on_checking_finished(self):
         """Handle spell checking completion."""
-        if self.enabled:
-            self.apply_highlights()
+        if self.sender() is not self.worker:
+            return
+        self._worker_done = True
+        if not self.enabled:
+            return
+
+        # Reset formatting over the checked text first, which also removes
+        # underlines that spread into newly typed characters
+        if self._worker_range is None:
+            start, end = 0, self.text_editor.document().characterCount() - 1
+        else:
+            start, end = self._worker_range
+        self._clear_range(start, end)
+        self._applied = {
+            (pos, length)
+            for pos, length in self._applied
+            if pos + length <= start or pos >= end
+        }
+        self.apply_highlights()
     
     @staticmethod
     def is_available() -> bool:
@@ -311,16 +645,20 @@ class SpellChecker(QObject):
         return ENCHANT_AVAILABLE
     
     @staticmethod
-    def get_available_languages() -> List[str]:
+    def get_available_languages() -> list[str]:
         """Get list of available spell check languages.
         
         Returns:
             List of available language tags
         """
+        global _available_languages
+
         if not ENCHANT_AVAILABLE:
             return []
 
         try:
-            return enchant.list_dicts()
+            if _available_languages is None:
+                _available_languages = enchant.list_dicts()
+            return list(_available_languages)
         except:
             return ["en_US"]  # Fallback
\ No newline at end of file
@@ -2,11 +2,6 @@
 
 import sys
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QApplication
-
-from ai_writer.ui import MainWindow, SplashManager
-
 
 def main() -> int:
     """Main application entry point.
@@ -14,10 +9,19 @@ def main() -> int:
     Returns:
         Exit code
     """
+    # Qt is imported here rather than at module level, since the ai_writer
+    # package imports this module and its Qt-free parts should load without it
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QApplication
+
     # Configure high DPI support
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
+    # Import the UI only once Qt is configured; this pulls in the bulk of
+    # the widget modules
+    from ai_writer.ui import MainWindow, SplashManager
+
     # Create application
     app = QApplication(sys.argv)
     app.setApplicationName("AI Writer")
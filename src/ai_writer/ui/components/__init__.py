@@ -1,10 +1,16 @@
 """UI components package."""
 
-from ai_writer.ui.components.prompt_manager import PromptManagerDialog
-from ai_writer.ui.components.prompt_selector import PromptSelector
-from ai_writer.ui.components.settings_dialog import SettingsDialog
-from ai_writer.ui.components.main_menu import MainMenuBar
-from ai_writer.ui.components.editor_toolbar import EditorToolbar
+import importlib
+
+# Exports are imported on first access, so dialogs the user never opens are
+# not loaded at startup
+_EXPORTS = {
+    "PromptManagerDialog": "ai_writer.ui.components.prompt_manager",
+    "PromptSelector": "ai_writer.ui.components.prompt_selector",
+    "SettingsDialog": "ai_writer.ui.components.settings_dialog",
+    "MainMenuBar": "ai_writer.ui.components.main_menu",
+    "EditorToolbar": "ai_writer.ui.components.editor_toolbar",
+}
 
 __all__ = [
     "PromptManagerDialog", 
@@ -13,3 +19,13 @@ __all__ = [
     "MainMenuBar",
     "EditorToolbar",
 ]
+
+
+def __getattr__(name: str):
+    """Import an exported name from its submodule on first use."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
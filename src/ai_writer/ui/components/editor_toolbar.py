@@ -1,6 +1,7 @@
 """Toolbar component for the AI Writer application."""
 
 from PyQt5.QtCore import QSize, pyqtSignal
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import (
     QComboBox,
     QLabel,
@@ -21,9 +22,14 @@ class EditorToolbar(QToolBar):
     model_changed = pyqtSignal()
     prompt_changed = pyqtSignal(str)
     generate_requested = pyqtSignal()
+    cancel_requested = pyqtSignal()
     save_txt_requested = pyqtSignal()
     save_docx_requested = pyqtSignal()
 
+    # Theme button labels; each shows the theme the button switches to
+    _MOON = "🌙"
+    _SUN = "☀️"
+
     def __init__(self, parent: QWidget | None = None, current_theme: str = "light", has_docx_support: bool = False):
         """Initialize the editor toolbar.
 
@@ -43,7 +49,7 @@ class EditorToolbar(QToolBar):
     def _setup_ui(self):
         """Build the toolbar widget structure."""
         # Theme toggle
-        self.theme_btn = QPushButton("🌙" if self.current_theme == "light" else "☀️")
+        self.theme_btn = QPushButton(self._theme_label(self.current_theme))
         self.theme_btn.setFixedWidth(40)
         self.theme_btn.clicked.connect(self.theme_toggled.emit)
         self.addWidget(self.theme_btn)
@@ -53,7 +59,8 @@ class EditorToolbar(QToolBar):
         # Model selection
         self.model_combo = QComboBox()
         self.model_combo.setMinimumWidth(180)
-        self.model_combo.addItem("Select model...")
+        # Shown while no model is selected, without a fake model row
+        self.model_combo.setPlaceholderText("Select model...")
         self.model_combo.currentTextChanged.connect(self._on_model_combo_changed)
         
         self.addWidget(QLabel("  Model: "))
@@ -81,6 +88,13 @@ class EditorToolbar(QToolBar):
         self.generate_btn.setEnabled(False)
         self.addWidget(self.generate_btn)
 
+        # Cancel button (only enabled while a generation is streaming)
+        self.cancel_btn = QPushButton("⏹ Stop")
+        self.cancel_btn.setToolTip("Stop generating")
+        self.cancel_btn.clicked.connect(self.cancel_requested.emit)
+        self.cancel_btn.setEnabled(False)
+        self.addWidget(self.cancel_btn)
+
         self.addSeparator()
 
         # Save buttons
@@ -88,12 +102,12 @@ class EditorToolbar(QToolBar):
         self.save_txt_btn.clicked.connect(self.save_txt_requested.emit)
         self.addWidget(self.save_txt_btn)
 
-        if self.has_docx_support:
-            self.save_doc_btn = QPushButton("📕 Save .docx")
-            self.save_doc_btn.clicked.connect(self.save_docx_requested.emit)
-            self.addWidget(self.save_doc_btn)
-        else:
-            self.addWidget(QLabel("  (install python-docx for .docx)"))
+        self.save_doc_btn = QPushButton("📕 Save .docx")
+        self.save_doc_btn.clicked.connect(self.save_docx_requested.emit)
+        if not self.has_docx_support:
+            self.save_doc_btn.setEnabled(False)
+            self.save_doc_btn.setToolTip("Install python-docx to save .docx files")
+        self.addWidget(self.save_doc_btn)
 
         # Stretch and character count
         stretch_widget = QWidget()
@@ -108,22 +122,35 @@ class EditorToolbar(QToolBar):
     def set_theme_icon(self, theme: str):
         """Update the theme button icon."""
         self.current_theme = theme
-        self.theme_btn.setText("☀️" if theme == "dark" else "🌙")
+        label = self._theme_label(theme)
+        if self.theme_btn.text() != label:
+            self.theme_btn.setText(label)
+
+    @classmethod
+    def _theme_label(cls, theme: str) -> str:
+        """Get the theme button label for the given current theme."""
+        return cls._SUN if theme == "dark" else cls._MOON
 
     def set_models(self, models: list[str], default_model: str | None = None):
         """Update the available models combo box."""
+        # Build the new list off-screen and swap it in with one model reset,
+        # instead of clearing the combo and filling it again
+        model = QStandardItemModel(self.model_combo)
+        for name in models:
+            model.appendRow(QStandardItem(name))
+
         # Block signals to prevent spurious model_changed emits
         self.model_combo.blockSignals(True)
-        self.model_combo.clear()
-        
-        if not models:
-            self.model_combo.addItem("No models found")
-        else:
-            self.model_combo.addItems(models)
+        try:
+            self.model_combo.setModel(model)
+            self.model_combo.setPlaceholderText(
+                "Select model..." if models else "No models found"
+            )
+            self.model_combo.setEnabled(bool(models))
             if default_model and default_model in models:
                 self.model_combo.setCurrentText(default_model)
-                
-        self.model_combo.blockSignals(False)
+        finally:
+            self.model_combo.blockSignals(False)
 
     def current_model(self) -> str:
         """Get the currently selected model."""
@@ -133,6 +160,10 @@ class EditorToolbar(QToolBar):
         """Enable or disable the generate button."""
         self.generate_btn.setEnabled(enabled)
 
+    def set_cancel_enabled(self, enabled: bool):
+        """Enable or disable the cancel button."""
+        self.cancel_btn.setEnabled(enabled)
+
     def set_generate_text(self, text: str):
         """Update the text of the generate button."""
         self.generate_btn.setText(text)
@@ -150,7 +181,7 @@ class EditorToolbar(QToolBar):
     def _on_model_combo_changed(self, model_name: str):
         """Handle internal combobox changes and forward signal."""
         # Update nested prompt selector filter
-        if model_name and model_name not in ["Select model...", "No models found"]:
+        if self.model_combo.currentIndex() >= 0:
             self.prompt_selector.set_model_filter(model_name)
         
         self.model_changed.emit()
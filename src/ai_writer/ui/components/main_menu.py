@@ -1,7 +1,7 @@
 """Main menu bar component for the AI Writer application."""
 
 from PyQt5.QtCore import pyqtSignal
-from PyQt5.QtWidgets import QAction, QMenuBar, QWidget
+from PyQt5.QtWidgets import QAction, QMenu, QMenuBar, QWidget
 
 from ai_writer.config import get_settings
 from ai_writer.core.spell_checker import SpellChecker
@@ -43,45 +43,29 @@ class MainMenuBar(QMenuBar):
         """Build the menu structure."""
         # --- File Menu ---
         file_menu = self.addMenu("&File")
-
-        new_action = QAction("&New", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.setStatusTip("Create a new document")
-        new_action.triggered.connect(self.new_file_requested.emit)
-        file_menu.addAction(new_action)
-
-        open_action = QAction("&Open...", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.setStatusTip("Open an existing document")
-        open_action.triggered.connect(self.open_file_requested.emit)
-        file_menu.addAction(open_action)
-
-        file_menu.addSeparator()
-
-        save_action = QAction("&Save", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.setStatusTip("Save the current document")
-        save_action.triggered.connect(self.save_file_requested.emit)
-        file_menu.addAction(save_action)
+        self._add_actions(file_menu, [
+            ("&New", "Ctrl+N", "Create a new document", self.new_file_requested),
+            ("&Open...", "Ctrl+O", "Open an existing document",
+             self.open_file_requested),
+            None,
+            ("&Save", "Ctrl+S", "Save the current document",
+             self.save_file_requested),
+        ])
 
         save_as_menu = file_menu.addMenu("Save &As")
-
-        save_txt_action = QAction("Text File (.txt)", self)
-        save_txt_action.triggered.connect(self.save_as_txt_requested.emit)
-        save_as_menu.addAction(save_txt_action)
-
+        save_as_actions = [
+            ("Text File (.txt)", None, None, self.save_as_txt_requested),
+        ]
         if self.has_docx_support:
-            save_docx_action = QAction("Word Document (.docx)", self)
-            save_docx_action.triggered.connect(self.save_as_docx_requested.emit)
-            save_as_menu.addAction(save_docx_action)
-
-        file_menu.addSeparator()
+            save_as_actions.append(
+                ("Word Document (.docx)", None, None, self.save_as_docx_requested)
+            )
+        self._add_actions(save_as_menu, save_as_actions)
 
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.setStatusTip("Exit the application")
-        exit_action.triggered.connect(self.exit_requested.emit)
-        file_menu.addAction(exit_action)
+        self._add_actions(file_menu, [
+            None,
+            ("E&xit", "Ctrl+Q", "Exit the application", self.exit_requested),
+        ])
 
         # --- Edit Menu ---
         edit_menu = self.addMenu("&Edit")
@@ -98,23 +82,36 @@ class MainMenuBar(QMenuBar):
 
         # --- Settings Menu ---
         settings_menu = self.addMenu("&Settings")
+        self._add_actions(settings_menu, [
+            ("&General Settings...", None,
+             "Configure temperature, tokens, and Ollama URL",
+             self.general_settings_requested),
+            None,
+            ("&Manage Prompts...", None, None, self.manage_prompts_requested),
+            None,
+            ("&About AI-Writer", None, None, self.about_requested),
+        ])
+
+    def _add_actions(self, menu: QMenu, specs: list) -> None:
+        """Add actions to a menu from a list of specs.
 
-        gen_settings_action = QAction("&General Settings...", self)
-        gen_settings_action.setStatusTip("Configure temperature, tokens, and Ollama URL")
-        gen_settings_action.triggered.connect(self.general_settings_requested.emit)
-        settings_menu.addAction(gen_settings_action)
-
-        settings_menu.addSeparator()
-
-        prompts_action = QAction("&Manage Prompts...", self)
-        prompts_action.triggered.connect(self.manage_prompts_requested.emit)
-        settings_menu.addAction(prompts_action)
-
-        settings_menu.addSeparator()
-
-        about_action = QAction("&About AI-Writer", self)
-        about_action.triggered.connect(self.about_requested.emit)
-        settings_menu.addAction(about_action)
+        Args:
+            menu: Menu to add the actions to
+            specs: (text, shortcut, status tip, signal) tuples, where shortcut
+                and status tip may be None; a None entry adds a separator
+        """
+        for spec in specs:
+            if spec is None:
+                menu.addSeparator()
+                continue
+            text, shortcut, tip, signal = spec
+            action = QAction(text, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            if tip:
+                action.setStatusTip(tip)
+            action.triggered.connect(signal.emit)
+            menu.addAction(action)
 
     def set_spell_check_enabled(self, checked: bool):
         """Update the spell check toggle state programmatically."""
@@ -1,6 +1,7 @@
 """Prompt management dialog for AI Writer."""
 
-from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtCore import QSize, Qt, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QComboBox,
     QDialog,
@@ -12,18 +13,67 @@ from PyQt5.QtWidgets import (
     QListWidgetItem,
     QPushButton,
     QSplitter,
+    QStyle,
     QTextEdit,
     QVBoxLayout,
     QWidget,
     QMessageBox,
 )
 
-from ai_writer.core import get_prompt_manager
+from ai_writer.core import get_prompt_manager, initialize_default_prompts
 from ai_writer.config.settings import Prompt
 
+# Standard icons resolved so far, shared by every dialog instance
+_ICONS: dict[int, QIcon] = {}
+
+
+def _icon(style: QStyle, key: int) -> QIcon:
+    """Get a standard style icon, resolving it only the first time.
+
+    Args:
+        style: Style to take the icon from
+        key: QStyle standard pixmap identifier
+
+    Returns:
+        The cached icon
+    """
+    icon = _ICONS.get(key)
+    if icon is None:
+        icon = _ICONS[key] = style.standardIcon(key)
+    return icon
+
+
+# Delay after the last keystroke before the editor's change state is updated
+CONTENT_CHANGE_DELAY_MS = 50
+
+
+class _PromptItem(QListWidgetItem):
+    """List item that keeps the prompt it shows."""
+
+    def __init__(self, prompt: Prompt):
+        """Initialize the item.
+
+        Args:
+            prompt: Prompt shown by the item
+        """
+        super().__init__()
+        self.prompt = prompt
+        self.setData(Qt.UserRole, prompt.id)
+        self.refresh()
+
+    def refresh(self):
+        """Update the text and tooltip from the prompt."""
+        self.setText(self.prompt.name)
+        self.setToolTip(
+            f"Model: {self.prompt.language_model}\n{self.prompt.description}"
+        )
+
 
 class PromptManagerDialog(QDialog):
     """Dialog for managing prompt templates."""
+
+    prompts_changed = pyqtSignal()  # Emitted after a prompt is added, edited or removed
+    prompts_reloaded = pyqtSignal(list)  # Prompts to show, from any thread
     
     def __init__(self, parent=None):
         """Initialize the prompt manager dialog.
@@ -34,6 +84,13 @@ class PromptManagerDialog(QDialog):
         super().__init__(parent)
         self.prompt_manager = get_prompt_manager()
         self.current_prompt = None
+        # Queued, so a reload finished on another thread fills the list on
+        # the UI thread
+        self.prompts_reloaded.connect(self._apply_prompts, Qt.QueuedConnection)
+        # List item of each prompt, so edits update a single row in place
+        self._item_by_id: dict[str, _PromptItem] = {}
+        # Whether the save and revert buttons are currently enabled
+        self._dirty = False
         self._setup_ui()
         self._connect_signals()
         self.refresh_prompt_list()
@@ -85,11 +142,11 @@ class PromptManagerDialog(QDialog):
         list_buttons = QHBoxLayout()
         
         self.new_btn = QPushButton("New")
-        self.new_btn.setIcon(self.style().standardIcon(self.style().SP_FileIcon))
+        self.new_btn.setIcon(_icon(self.style(), QStyle.SP_FileIcon))
         list_buttons.addWidget(self.new_btn)
         
         self.delete_btn = QPushButton("Delete")
-        self.delete_btn.setIcon(self.style().standardIcon(self.style().SP_TrashIcon))
+        self.delete_btn.setIcon(_icon(self.style(), QStyle.SP_TrashIcon))
         self.delete_btn.setEnabled(False)
         list_buttons.addWidget(self.delete_btn)
         
@@ -144,12 +201,12 @@ class PromptManagerDialog(QDialog):
         editor_buttons = QHBoxLayout()
         
         self.save_btn = QPushButton("Save")
-        self.save_btn.setIcon(self.style().standardIcon(self.style().SP_DialogSaveButton))
+        self.save_btn.setIcon(_icon(self.style(), QStyle.SP_DialogSaveButton))
         self.save_btn.setEnabled(False)
         editor_buttons.addWidget(self.save_btn)
         
         self.revert_btn = QPushButton("Revert")
-        self.revert_btn.setIcon(self.style().standardIcon(self.style().SP_BrowserReload))
+        self.revert_btn.setIcon(_icon(self.style(), QStyle.SP_BrowserReload))
         self.revert_btn.setEnabled(False)
         editor_buttons.addWidget(self.revert_btn)
         
@@ -166,22 +223,48 @@ class PromptManagerDialog(QDialog):
         self.save_btn.clicked.connect(self._save_prompt)
         self.revert_btn.clicked.connect(self._revert_changes)
         
-        # Enable save/revert buttons when content changes
-        self.name_edit.textChanged.connect(self._on_content_changed)
-        self.desc_edit.textChanged.connect(self._on_content_changed)
-        self.content_edit.textChanged.connect(self._on_content_changed)
-        self.model_combo.currentTextChanged.connect(self._on_content_changed)
+        # Enable save/revert buttons when content changes; a burst of
+        # keystrokes is handled once typing pauses
+        self._content_timer = QTimer(self)
+        self._content_timer.setSingleShot(True)
+        self._content_timer.setInterval(CONTENT_CHANGE_DELAY_MS)
+        self._content_timer.timeout.connect(self._on_content_changed)
+        self.name_edit.textChanged.connect(self._content_timer.start)
+        self.desc_edit.textChanged.connect(self._content_timer.start)
+        self.content_edit.textChanged.connect(self._content_timer.start)
+        self.model_combo.currentTextChanged.connect(self._content_timer.start)
     
     def refresh_prompt_list(self):
-        """Refresh the prompt list."""
+        """Refresh the prompt list.
+
+        Safe to call from any thread; off the UI thread the prompts are
+        handed over through prompts_reloaded.
+        """
+        initialize_default_prompts()
+        prompts = self.prompt_manager.get_all_prompts()
+        if QThread.currentThread() is not self.thread():
+            self.prompts_reloaded.emit(list(prompts))
+        else:
+            self._apply_prompts(prompts)
+
+    def _apply_prompts(self, prompts: list):
+        """Fill the prompt list and select the first prompt.
+
+        Args:
+            prompts: Prompts to show, in display order
+        """
         self.prompt_list.clear()
+        self._item_by_id.clear()
         
-        prompts = self.prompt_manager.get_all_prompts()
-        for prompt in prompts:
-            item = QListWidgetItem(prompt.name)
-            item.setData(Qt.UserRole, prompt.id)
-            item.setToolTip(f"Model: {prompt.language_model}\\n{prompt.description}")
-            self.prompt_list.addItem(item)
+        # Fill the list with signals off, so adding rows selects nothing
+        self.prompt_list.blockSignals(True)
+        try:
+            for prompt in prompts:
+                item = _PromptItem(prompt)
+                self._item_by_id[prompt.id] = item
+                self.prompt_list.addItem(item)
+        finally:
+            self.prompt_list.blockSignals(False)
         
         if prompts:
             self.prompt_list.setCurrentRow(0)
@@ -197,9 +280,8 @@ class PromptManagerDialog(QDialog):
             self._clear_editor()
             return
             
-        item = self.prompt_list.item(row)
-        prompt_id = item.data(Qt.UserRole)
-        prompt = self.prompt_manager.get_prompt(prompt_id)
+        # Items hold the prompt itself, so no lookup in the store is needed
+        prompt = self.prompt_list.item(row).prompt
         
         if prompt:
             self.current_prompt = prompt
@@ -224,7 +306,10 @@ class PromptManagerDialog(QDialog):
         try:
             self.name_edit.setText(prompt.name)
             self.desc_edit.setText(prompt.description)
-            self.content_edit.setPlainText(prompt.content)
+            # Re-laying out a long prompt is the costly part, so skip it when
+            # the content is already shown
+            if self.content_edit.toPlainText() != prompt.content:
+                self.content_edit.setPlainText(prompt.content)
             
             # Set model combo
             index = self.model_combo.findText(prompt.language_model)
@@ -240,8 +325,8 @@ class PromptManagerDialog(QDialog):
             self.model_combo.blockSignals(False)
         
         # Reset change tracking
-        self.save_btn.setEnabled(False)
-        self.revert_btn.setEnabled(False)
+        self._content_timer.stop()
+        self._set_dirty(False)
     
     def _clear_editor(self):
         """Clear the editor fields."""
@@ -249,8 +334,7 @@ class PromptManagerDialog(QDialog):
         self.desc_edit.clear()
         self.content_edit.clear()
         self.model_combo.setCurrentIndex(0)
-        self.save_btn.setEnabled(False)
-        self.revert_btn.setEnabled(False)
+        self._set_dirty(False)
         self.delete_btn.setEnabled(False)
     
     def _create_new_prompt(self):
@@ -263,15 +347,12 @@ class PromptManagerDialog(QDialog):
             description=""
         )
         
-        # Refresh list and select the new prompt
-        self.refresh_prompt_list()
-        
-        # Find and select the new prompt
-        for i in range(self.prompt_list.count()):
-            item = self.prompt_list.item(i)
-            if item.data(Qt.UserRole) == new_prompt.id:
-                self.prompt_list.setCurrentRow(i)
-                break
+        # Append the new prompt to the list and select it
+        item = _PromptItem(new_prompt)
+        self._item_by_id[new_prompt.id] = item
+        self.prompt_list.addItem(item)
+        self.prompt_list.setCurrentItem(item)
+        self.prompts_changed.emit()
         
         # Focus name field for editing
         self.name_edit.selectAll()
@@ -292,8 +373,13 @@ class PromptManagerDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            self.prompt_manager.delete_prompt(self.current_prompt.id)
-            self.refresh_prompt_list()
+            prompt_id = self.current_prompt.id
+            self.prompt_manager.delete_prompt(prompt_id)
+            # Removing the row selects a neighbouring prompt, if any
+            item = self._item_by_id.pop(prompt_id, None)
+            if item is not None:
+                self.prompt_list.takeItem(self.prompt_list.row(item))
+            self.prompts_changed.emit()
     
     def _save_prompt(self):
         """Save the current prompt."""
@@ -322,19 +408,15 @@ class PromptManagerDialog(QDialog):
         )
         
         if success:
-            # Refresh the list to show updated name
-            self.refresh_prompt_list()
-            
-            # Find and reselect the updated prompt
-            for i in range(self.prompt_list.count()):
-                item = self.prompt_list.item(i)
-                if item.data(Qt.UserRole) == self.current_prompt.id:
-                    self.prompt_list.setCurrentRow(i)
-                    break
+            # Update just this row; the item shares the edited prompt
+            item = self._item_by_id.get(self.current_prompt.id)
+            if item is not None:
+                item.refresh()
+            self.prompts_changed.emit()
             
             # Reset change tracking
-            self.save_btn.setEnabled(False)
-            self.revert_btn.setEnabled(False)
+            self._content_timer.stop()
+            self._set_dirty(False)
     
     def _revert_changes(self):
         """Revert editor to the current prompt state."""
@@ -343,6 +425,25 @@ class PromptManagerDialog(QDialog):
     
     def _on_content_changed(self):
         """Handle content change in editor."""
-        if self.current_prompt:
-            self.save_btn.setEnabled(True)
-            self.revert_btn.setEnabled(True)
\ No newline at end of file
+        prompt = self.current_prompt
+        if not prompt:
+            return
+
+        # Editing back to the stored values leaves nothing to save or revert
+        self._set_dirty(
+            self.name_edit.text() != prompt.name
+            or self.desc_edit.text() != prompt.description
+            or self.model_combo.currentText() != prompt.language_model
+            or self.content_edit.toPlainText() != prompt.content
+        )
+
+    def _set_dirty(self, dirty: bool):
+        """Enable or disable the save and revert buttons.
+
+        Args:
+            dirty: Whether the editor differs from the current prompt
+        """
+        if dirty != self._dirty:
+            self._dirty = dirty
+            self.save_btn.setEnabled(dirty)
+            self.revert_btn.setEnabled(dirty)
\ No newline at end of file
@@ -1,16 +1,17 @@
 """Prompt selector component for AI Writer."""
 
-from PyQt5.QtCore import QSize, Qt, pyqtSignal
+from PyQt5.QtCore import QEvent, QSize, Qt, pyqtSignal
 from PyQt5.QtWidgets import (
     QComboBox,
     QHBoxLayout,
     QLabel,
     QPushButton,
+    QToolTip,
     QVBoxLayout,
     QWidget,
 )
 
-from ai_writer.core import get_prompt_manager
+from ai_writer.core import get_prompt_manager, initialize_default_prompts
 
 
 class PromptSelector(QWidget):
@@ -27,6 +28,16 @@ class PromptSelector(QWidget):
         super().__init__(parent)
         self.prompt_manager = get_prompt_manager()
         self.current_model = "all"  # Track current model for filtering
+        # Created on first use and kept, so reopening it is instant
+        self._prompt_manager_dialog = None
+        # Combo index of each listed prompt, rebuilt with the combo
+        self._index_by_id: dict[str, int] = {}
+        # Preview shown as the combo tooltip; built on first hover after a
+        # selection change
+        self._tooltip_text: str | None = None
+        # Content of the selected prompt, looked up when the selection or
+        # the prompt list changes
+        self._selected_content: str | None = None
         self._setup_ui()
         self._connect_signals()
         self.refresh_prompts()
@@ -40,7 +51,7 @@ class PromptSelector(QWidget):
         # Dropdown for prompt selection
         self.prompt_combo = QComboBox()
         self.prompt_combo.setMinimumWidth(140)
-        self.prompt_combo.setToolTip("Select a prompt template")
+        self.prompt_combo.installEventFilter(self)
         layout.addWidget(self.prompt_combo)
         
         # Manage prompts button
@@ -52,30 +63,48 @@ class PromptSelector(QWidget):
     def _connect_signals(self):
         """Connect widget signals."""
         self.prompt_combo.currentIndexChanged.connect(self._on_prompt_selection_changed)
-        self.manage_btn.clicked.connect(self._open_prompt_manager)
+        self.manage_btn.clicked.connect(self.open_prompt_manager)
     
     def refresh_prompts(self):
         """Refresh the prompt list for the current model."""
         current_selection = self.get_selected_prompt_id()
-        
-        # Clear combo box
-        self.prompt_combo.clear()
-        
-        # Add "None" option
-        self.prompt_combo.addItem("No prompt", None)
-        
-        # Add prompts for current model
+
+        # Create the default prompts the first time any are listed
+        initialize_default_prompts()
+        # The prompt manager memoizes the list for each model
         prompts = self.prompt_manager.get_prompts_for_model(self.current_model)
-        for prompt in prompts:
-            self.prompt_combo.addItem(f"{prompt.name}", prompt.id)
-        
-        # Restore selection if possible
-        if current_selection:
-            index = self.prompt_combo.findData(current_selection)
-            if index >= 0:
-                self.prompt_combo.setCurrentIndex(index)
-        
-        self._update_preview()
+        items = [(prompt.name, prompt.id) for prompt in prompts]
+        self._index_by_id = {
+            prompt_id: index for index, (_, prompt_id) in enumerate(items, start=1)
+        }
+
+        # Rebuild with signals blocked, so the intermediate selections of
+        # clear() and addItem() do not each save settings and emit
+        self.prompt_combo.blockSignals(True)
+        try:
+            self.prompt_combo.clear()
+            
+            # Add "None" option
+            self.prompt_combo.addItem("No prompt", None)
+            
+            # Add prompts for current model
+            for name, prompt_id in items:
+                self.prompt_combo.addItem(name, prompt_id)
+            
+            # Restore selection if possible
+            if current_selection:
+                index = self._index_by_id.get(current_selection, -1)
+                if index >= 0:
+                    self.prompt_combo.setCurrentIndex(index)
+        finally:
+            self.prompt_combo.blockSignals(False)
+
+        self._tooltip_text = None
+        if self.get_selected_prompt_id() != current_selection:
+            self._on_prompt_selection_changed()
+        else:
+            # The selected prompt itself may have been edited
+            self._selected_content = self._lookup_selected_content()
     
     def set_model_filter(self, model: str):
         """Set the current model for filtering prompts.
@@ -105,7 +134,7 @@ class PromptSelector(QWidget):
         if prompt_id is None:
             self.prompt_combo.setCurrentIndex(0)  # "No prompt" option
         else:
-            index = self.prompt_combo.findData(prompt_id)
+            index = self._index_by_id.get(prompt_id, -1)
             if index >= 0:
                 self.prompt_combo.setCurrentIndex(index)
     
@@ -115,6 +144,10 @@ class PromptSelector(QWidget):
         Returns:
             Prompt content or None if no prompt selected
         """
+        return self._selected_content
+
+    def _lookup_selected_content(self) -> str | None:
+        """Look up the content of the selected prompt in the prompt manager."""
         prompt_id = self.get_selected_prompt_id()
         if not prompt_id:
             return None
@@ -129,29 +162,46 @@ class PromptSelector(QWidget):
         # Update settings
         self.prompt_manager.set_selected_prompt(prompt_id)
         
-        # Update preview
-        self._update_preview()
+        # Rebuild the preview on the next hover
+        self._tooltip_text = None
         
+        self._selected_content = self._lookup_selected_content()
+
         # Emit signal
-        content = self.get_selected_prompt_content() or ""
-        self.prompt_changed.emit(content)
+        self.prompt_changed.emit(self._selected_content or "")
     
-    def _update_preview(self):
-        """Update the prompt tooltip with preview."""
-        content = self.get_selected_prompt_content()
-        if not content:
-            self.prompt_combo.setToolTip("No prompt selected")
-        else:
-            preview = content.strip()
-            if len(preview) > 100:
-                preview = preview[:97] + "..."
-            self.prompt_combo.setToolTip(preview)
+    def eventFilter(self, obj, event) -> bool:
+        """Show the prompt preview when the combo's tooltip is requested."""
+        if obj is self.prompt_combo and event.type() == QEvent.ToolTip:
+            QToolTip.showText(event.globalPos(), self._preview_text(), obj)
+            return True
+        return super().eventFilter(obj, event)
+
+    def _preview_text(self) -> str:
+        """Get the tooltip preview of the selected prompt, building it once."""
+        if self._tooltip_text is None:
+            content = self.get_selected_prompt_content()
+            if not content:
+                self._tooltip_text = "No prompt selected"
+            else:
+                preview = content.strip()
+                if len(preview) > 100:
+                    preview = preview[:97] + "..."
+                self._tooltip_text = preview
+        return self._tooltip_text
     
-    def _open_prompt_manager(self):
-        """Open the prompt management dialog."""
-        from ai_writer.ui.components.prompt_manager import PromptManagerDialog
-        
-        dialog = PromptManagerDialog(self)
-        if dialog.exec_() == dialog.Accepted:
-            # Refresh prompts after dialog closes
-            self.refresh_prompts()
\ No newline at end of file
+    def open_prompt_manager(self):
+        """Open the prompt management dialog, reusing it after the first time."""
+        dialog = self._prompt_manager_dialog
+        if dialog is None:
+            from ai_writer.ui.components.prompt_manager import PromptManagerDialog
+
+            dialog = self._prompt_manager_dialog = PromptManagerDialog(self)
+            dialog.prompts_changed.connect(self.refresh_prompts)
+            dialog.finished.connect(self.refresh_prompts)
+        else:
+            dialog.refresh_prompt_list()
+
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
\ No newline at end of file
@@ -30,13 +30,14 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Settings")
         self.setMinimumWidth(400)
         layout = QVBoxLayout(self)
+        generation = self.settings.generation
 
         # Temperature
         layout.addWidget(QLabel("🌡️ Temperature"))
         temp_layout = QHBoxLayout()
         self.temp_slider = QSlider(Qt.Horizontal)
-        self.temp_slider.setMinimum(int(self.settings.generation.min_temperature * 100))
-        self.temp_slider.setMaximum(int(self.settings.generation.max_temperature * 100))
+        self.temp_slider.setMinimum(int(generation.min_temperature * 100))
+        self.temp_slider.setMaximum(int(generation.max_temperature * 100))
         self.temp_slider.setTickPosition(QSlider.TicksBelow)
         self.temp_slider.setTickInterval(25)
         temp_layout.addWidget(self.temp_slider)
@@ -55,8 +56,8 @@ class SettingsDialog(QDialog):
         # Token Limit
         layout.addWidget(QLabel("📊 Token Limit"))
         self.token_spinbox = QSpinBox()
-        self.token_spinbox.setMinimum(self.settings.generation.min_token_limit)
-        self.token_spinbox.setMaximum(self.settings.generation.max_token_limit)
+        self.token_spinbox.setMinimum(generation.min_token_limit)
+        self.token_spinbox.setMaximum(generation.max_token_limit)
         self.token_spinbox.setSuffix(" tokens")
         layout.addWidget(self.token_spinbox)
 
@@ -81,15 +82,17 @@ class SettingsDialog(QDialog):
 
     def _load_settings(self):
         """Load current settings into UI components."""
-        self.temp_slider.setValue(int(self.settings.generation.default_temperature * 100))
-        self.temp_label.setText(f"{self.settings.generation.default_temperature:.2f}")
-        self.token_spinbox.setValue(self.settings.generation.default_token_limit)
+        generation = self.settings.generation
+        self.temp_slider.setValue(int(generation.default_temperature * 100))
+        self.temp_label.setText(f"{generation.default_temperature:.2f}")
+        self.token_spinbox.setValue(generation.default_token_limit)
         self.ollama_url_input.setText(self.settings.ollama.url)
 
     def accept(self):
         """Save settings and close dialog."""
-        self.settings.generation.default_temperature = self.temp_slider.value() / 100.0
-        self.settings.generation.default_token_limit = self.token_spinbox.value()
+        generation = self.settings.generation
+        generation.default_temperature = self.temp_slider.value() / 100.0
+        generation.default_token_limit = self.token_spinbox.value()
         self.settings.ollama.url = self.ollama_url_input.text().strip()
         save_settings()
         super().accept()
@@ -1,9 +1,10 @@
 """Main window for the AI Writer application."""
 
-from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtCore import QSize, Qt, QTimer, pyqtSlot
 from PyQt5.QtWidgets import (
     QAction,
     QComboBox,
+    QFileDialog,
     QFrame,
     QHBoxLayout,
     QLabel,
@@ -25,10 +26,24 @@ from PyQt5.QtWidgets import (
 )
 
 from ai_writer.config import get_settings, save_settings
-from ai_writer.core import FileManager, OllamaClient, initialize_default_prompts
+from ai_writer.core import FileManager, OllamaClient
+from ai_writer.core.ollama_api import (
+    DEFAULT_CONTEXT_CHARS,
+    load_cached_models,
+    save_cached_models,
+    trim_context,
+)
 from ai_writer.core.spell_checker import SpellChecker
-from ai_writer.ui.styles import DARK_THEME, LIGHT_THEME
-from ai_writer.ui.components import PromptSelector, SettingsDialog, PromptManagerDialog, MainMenuBar, EditorToolbar
+from ai_writer.ui.styles import STYLES, THEMED_STYLESHEET
+from ai_writer.ui.components import EditorToolbar, MainMenuBar
+
+# Delay before settings changed from the UI are written to disk; further
+# changes within it are saved by the same write
+SETTINGS_SAVE_DELAY_MS = 500
+
+# Delay before the selected model is preloaded, so stepping through the
+# model list does not load every model passed on the way
+WARMUP_DELAY_MS = 800
 
 
 class MainWindow(QMainWindow):
@@ -40,9 +55,6 @@ class MainWindow(QMainWindow):
         self.settings = get_settings()
         self.file_manager = FileManager(self)
         
-        # Initialize default prompts if none exist
-        initialize_default_prompts()
-        
         # Initialize spell checker
         self.spell_checker = None
         
@@ -58,21 +70,58 @@ class MainWindow(QMainWindow):
         self._setup_menubar()
 
         # Start model scan
+        self.scan_models()
         self.setWindowTitle("AI Writer")
 
     def _setup_window(self):
         """Set up basic window properties."""
+        ui_settings = self.settings.ui
         self.setMinimumSize(
-            self.settings.ui.window_width, self.settings.ui.window_height
+            ui_settings.window_width, ui_settings.window_height
         )
-        self.current_theme = self.settings.ui.default_theme
-        self.setStyleSheet(LIGHT_THEME if self.current_theme == "light" else DARK_THEME)
+        self.current_theme = ui_settings.default_theme
+        if self.current_theme not in STYLES:
+            self.current_theme = "light"
+        self.setProperty("theme", self.current_theme)
+        self.setStyleSheet(THEMED_STYLESHEET)
 
     def _init_state(self):
         """Initialize application state."""
-        self.temperature = self.settings.generation.default_temperature
-        self.token_limit = self.settings.generation.default_token_limit
+        generation = self.settings.generation
+        self.temperature = generation.default_temperature
+        self.token_limit = generation.default_token_limit
         self.generation_cursor_pos = 0
+        self.context_chars = DEFAULT_CONTEXT_CHARS
+        self._last_char_was_space = True
+        self._awaiting_first_chunk = False
+        # Set once streamed text was inserted with the editor's signals blocked
+        self._stream_inserted = False
+        # (character count, model) last shown by _on_text_changed; None when
+        # the generate button was changed elsewhere since
+        self._last_text_state: tuple[int, str] | None = None
+
+        # Background Ollama workers (run on the shared thread pool)
+        self.worker = None
+        self.scan_worker = None
+        self._models_hash = None
+        self.warmup_worker = None
+        self._warmed_models = set()
+        self._warmup_timer = QTimer(self)
+        self._warmup_timer.setSingleShot(True)
+        self._warmup_timer.setInterval(WARMUP_DELAY_MS)
+        self._warmup_timer.timeout.connect(self._warm_up_selected_model)
+
+        # File write in progress, and saves requested while it runs; saves
+        # run one at a time so two writes never race on the same file
+        self.save_worker = None
+        self._queued_saves: list = []
+
+        # Sliders and toggles can change settings many times a second, so
+        # their writes are coalesced; closeEvent flushes any pending save
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._settings_save_timer.timeout.connect(save_settings)
 
     def _setup_ui(self):
         """Set up the user interface."""
@@ -110,6 +159,7 @@ class MainWindow(QMainWindow):
         self.main_menu.manage_prompts_requested.connect(self._open_prompt_manager)
         self.main_menu.about_requested.connect(self._show_about_dialog)
 
+    @pyqtSlot()
     def _on_new_file(self):
         """Clear document and reset state for a new file."""
         if self.editor.toPlainText().strip():
@@ -125,9 +175,9 @@ class MainWindow(QMainWindow):
         self.file_manager.current_file = None
         self.statusBar.showMessage("New document created")
 
+    @pyqtSlot()
     def _on_open_file(self):
         """Open a file dialog and load the selected file."""
-        from PyQt5.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Open File", "", 
             "All Supported (*.txt *.docx *.md);;Text Files (*.txt);;Word Documents (*.docx);;Markdown (*.md)"
@@ -139,23 +189,18 @@ class MainWindow(QMainWindow):
                 self.editor.setPlainText(content)
                 self.statusBar.showMessage(f"Loaded {file_path}")
 
+    @pyqtSlot()
     def _on_save_file(self):
         """Save the current document."""
-        text = self.editor.toPlainText()
-        if self.file_manager.current_file:
+        path = self.file_manager.current_file
+        if path:
             # If we already have a file path, save to it directly
-            path = self.file_manager.current_file
-            if path.endswith(".docx"):
-                success = self.file_manager.save_as_docx(text, file_path=path)
-            else:
-                success = self.file_manager.save_as_txt(text, file_path=path)
-            
-            if success:
-                self.statusBar.showMessage(f"Saved to {path}")
+            fmt = "docx" if path.endswith(".docx") else "txt"
         else:
             # Otherwise use default format (Save As)
-            if self.file_manager.save_with_default_format(text):
-                self.statusBar.showMessage(f"Saved to {self.file_manager.current_file}")
+            default_format = self.settings.file.default_save_format.lower()
+            fmt = "docx" if default_format == "docx" else "txt"
+        self._start_save(fmt, path)
 
     def _on_spell_check_menu_toggled(self, enabled: bool):
         """Sync spell check menu toggle."""
@@ -163,11 +208,15 @@ class MainWindow(QMainWindow):
 
     def _show_settings_dialog(self):
         """Show the integrated settings dialog."""
+        from ai_writer.ui.components import SettingsDialog
+
         dialog = SettingsDialog(self)
         if dialog.exec_() == SettingsDialog.Accepted:
             # Refresh state if needed (though SettingsDialog saves to global settings)
             self.temperature = self.settings.generation.default_temperature
             self.token_limit = self.settings.generation.default_token_limit
+            # The Ollama server may have changed; don't reuse its model list
+            OllamaClient.invalidate_model_cache()
             self.statusBar.showMessage("Settings updated", 3000)
 
     def _show_about_dialog(self):
@@ -200,10 +249,14 @@ class MainWindow(QMainWindow):
         
         # Connect toolbar signals
         self.toolbar.theme_toggled.connect(self.toggle_theme)
-        self.toolbar.scan_requested.connect(self.scan_models)
+        self.toolbar.scan_requested.connect(
+            lambda: self.scan_models(force_refresh=True)
+        )
         self.toolbar.model_changed.connect(self._on_text_changed)
+        self.toolbar.model_changed.connect(self._on_model_selected)
         self.toolbar.prompt_changed.connect(self._on_prompt_changed)
         self.toolbar.generate_requested.connect(self.start_generation)
+        self.toolbar.cancel_requested.connect(self.cancel_generation)
         self.toolbar.save_txt_requested.connect(self._save_as_txt)
         self.toolbar.save_docx_requested.connect(self._save_as_docx)
         
@@ -216,17 +269,21 @@ class MainWindow(QMainWindow):
             "Start writing your story here... "
             "Press 'Generate' to let AI continue from your cursor position."
         )
-        self.editor.textChanged.connect(self._on_text_changed)
         editor_layout.addWidget(self.editor)
 
+        # Coalesce bursts of keystrokes into a single status update
+        self._text_update_timer = QTimer(self)
+        self._text_update_timer.setSingleShot(True)
+        self._text_update_timer.setInterval(150)
+        self._text_update_timer.timeout.connect(self._on_text_changed)
+        self.editor.textChanged.connect(self._text_update_timer.start)
+
         return editor_widget
 
     def _open_prompt_manager(self):
         """Open the prompt management dialog."""
-        dialog = PromptManagerDialog(self)
-        if dialog.exec_() == dialog.Accepted:
-            # Re-fetch prompts
-            self.toolbar.get_prompt_selector().refresh_prompts()
+        # The selector owns the dialog, so the menu and toolbar share one
+        self.toolbar.get_prompt_selector().open_prompt_manager()
 
     def _connect_signals(self):
         """Connect additional signals."""
@@ -236,41 +293,47 @@ class MainWindow(QMainWindow):
     # Event handlers
     def toggle_theme(self):
         """Toggle between light and dark themes."""
-        if self.current_theme == "light":
-            self.current_theme = "dark"
-            self.setStyleSheet(DARK_THEME)
-        else:
-            self.current_theme = "light"
-            self.setStyleSheet(LIGHT_THEME)
+        self.current_theme = "dark" if self.current_theme == "light" else "light"
+
+        # The stylesheet covers both themes; only the property selector changes,
+        # so re-polishing is enough and no QSS has to be parsed again
+        self.setProperty("theme", self.current_theme)
+        style = self.style()
+        for widget in (self, *self.findChildren(QWidget)):
+            style.unpolish(widget)
+            style.polish(widget)
 
         self.toolbar.set_theme_icon(self.current_theme)
 
         # Update settings
         self.settings.ui.default_theme = self.current_theme
-        save_settings()
+        self._schedule_settings_save()
 
+    @pyqtSlot(int)
     def _on_temperature_changed(self, value: int):
         """Handle temperature slider change."""
         self.temperature = value / 100.0
         self.temp_value_label.setText(f"{self.temperature:.2f}")
         self.settings.generation.default_temperature = self.temperature
-        save_settings()
+        self._schedule_settings_save()
 
+    @pyqtSlot(int)
     def _on_token_limit_changed(self, value: int):
         """Handle token limit change."""
         self.token_limit = value
         self.statusBar.showMessage(f"Token limit set to {self.token_limit} tokens")
         self.settings.generation.default_token_limit = self.token_limit
-        save_settings()
+        self._schedule_settings_save()
 
     def _on_ollama_url_changed(self):
         """Handle Ollama URL change."""
         new_url = self.ollama_url_input.text().strip()
         if new_url and new_url != self.settings.ollama.url:
             self.settings.ollama.url = new_url
-            save_settings()
+            self._schedule_settings_save()
             self.statusBar.showMessage(f"Ollama URL updated to {new_url}")
     
+    @pyqtSlot(str)
     def _on_prompt_changed(self, prompt_content: str):
         """Handle prompt template selection change.
         
@@ -279,72 +342,152 @@ class MainWindow(QMainWindow):
         """
         # Update model filter in prompt selector when model changes
         current_model = self.toolbar.current_model()
-        if current_model and current_model not in ["Select model...", "No models found"]:
+        if current_model:
             self.toolbar.get_prompt_selector().set_model_filter(current_model)
 
+    @pyqtSlot()
     def _on_text_changed(self):
         """Handle text editor content change."""
-        text = self.editor.toPlainText()
-        self.toolbar.set_character_count(len(text))
-
+        # characterCount() includes the trailing paragraph separator
+        char_count = self.editor.document().characterCount() - 1
         model = self.toolbar.current_model()
-        has_text = len(text.strip()) > 0
-        has_model = model not in ["Select model...", "No models found"]
+        # Cursor moves and formatting changes leave both untouched
+        state = (char_count, model)
+        if state == self._last_text_state:
+            return
+        self._last_text_state = state
+
+        self.toolbar.set_character_count(char_count)
+        has_text = char_count > 0
+        has_model = bool(model)
         self.toolbar.set_generate_enabled(has_text and has_model)
 
     # Ollama operations
-    def scan_models(self):
-        """Scan for available Ollama models."""
+    def scan_models(self, force_refresh: bool = False):
+        """Scan for available Ollama models.
+
+        Args:
+            force_refresh: Ignore the cached model list (used by the refresh button)
+        """
+        # Offer the last known models right away; the scan below replaces
+        # them only if the server reports a different list
+        if self.toolbar.model_combo.count() == 0:
+            cached_models = load_cached_models(self.settings.ollama.url)
+            if cached_models:
+                self._on_models_loaded(cached_models)
+
         self.statusBar.showMessage("Scanning for models...")
-        self.toolbar.set_models([]) # Clear combo box
 
-        self.worker = OllamaClient.scan_models()
-        self.worker.models_loaded.connect(self._on_models_loaded)
-        self.worker.error.connect(self._on_error)
-        self.worker.start()
+        self._stop_worker(self.scan_worker)
+        self.scan_worker = OllamaClient.scan_models(force_refresh=force_refresh)
+        self.scan_worker.models_loaded.connect(self._on_models_loaded)
+        self.scan_worker.error.connect(self._on_scan_error)
+        self.scan_worker.start()
 
+    @pyqtSlot(list)
     def _on_models_loaded(self, models):
         """Handle successful model loading."""
+        # Leave the combo box (and the user's selection) alone if nothing changed
+        models_hash = hash(tuple(models))
+        if models_hash == self._models_hash:
+            if models:
+                self.statusBar.showMessage(f"✓ {len(models)} models available")
+            else:
+                self.statusBar.showMessage("❌ No models available")
+            return
+        self._models_hash = models_hash
+        if models:
+            save_cached_models(self.settings.ollama.url, models)
+
         if not models:
             self.toolbar.set_models([])
             self.statusBar.showMessage("❌ No models available")
             self.toolbar.set_generate_enabled(False)
+            self._last_text_state = None
         else:
-            default_model = None
-            if (
-                self.settings.ollama.default_model
-                and self.settings.ollama.default_model in models
-            ):
+            # Keep the current selection if it is still available
+            selected_model = self.toolbar.current_model()
+            if selected_model not in models:
                 default_model = self.settings.ollama.default_model
+                selected_model = (
+                    default_model if default_model and default_model in models else None
+                )
 
-            self.toolbar.set_models(models, default_model)
+            self.toolbar.set_models(models, selected_model)
             self.statusBar.showMessage(f"✓ {len(models)} models available")
 
             self._on_text_changed()
+            self._on_model_selected()
+
+    @pyqtSlot(str)
+    def _on_scan_error(self, error_msg: str):
+        """Handle a failed model scan."""
+        if self.toolbar.model_combo.count() == 0:
+            self._on_error(error_msg)
+            return
+        # Keep working with the last known models instead of interrupting
+        self.statusBar.showMessage(
+            f"⚠️ Could not refresh models, using the last known list: {error_msg}"
+        )
+
+    @pyqtSlot()
+    def _on_model_selected(self):
+        """Preload the selected model once the selection settles."""
+        # Restarting the timer pushes the warm-up back
+        self._warmup_timer.start()
+
+    def _warm_up_selected_model(self):
+        """Preload the selected model in the background, once per session."""
+        model = self.toolbar.current_model()
+        if not model:
+            return
+        if model in self._warmed_models:
+            return
+
+        # Only the latest selection is worth loading. Cancelling drops a
+        # warm-up still queued; one already sent keeps loading its model,
+        # so that model stays marked as warmed.
+        previous = self.warmup_worker
+        if previous is not None and previous.isRunning():
+            previous.cancel()
+        self._warmed_models.add(model)
+
+        # Failures are ignored; the real generation reports any problem
+        self.warmup_worker = OllamaClient.warm_up_model(model)
+        self.warmup_worker.start()
 
     def start_generation(self):
         """Start text generation process."""
         text = self.editor.toPlainText()
         model = self.toolbar.current_model()
 
-        if not text.strip() or model in ["Select model...", "No models found"]:
+        if not text.strip() or not model:
             QMessageBox.warning(
                 self, "Warning", "Please enter text and select a model."
             )
             return
 
         self.generation_cursor_pos = len(text)
-
-        # Prepare the prompt - use template if selected
-        full_prompt = self._prepare_prompt_for_generation(text)
+        # Remember whether the first chunk needs a separating space so the
+        # chunk handler never has to re-read the whole document
+        self._last_char_was_space = text[-1:].isspace() if text else True
+        self._awaiting_first_chunk = True
+
+        # Prepare the prompt from the end of the document - use template if selected
+        full_prompt = self._prepare_prompt_for_generation(
+            trim_context(text, self.context_chars)
+        )
 
         self.toolbar.set_generate_enabled(False)
+        self._last_text_state = None
+        self.toolbar.set_cancel_enabled(True)
         self.toolbar.set_generate_text("⏳ Generating...")
         self.statusBar.showMessage(
             f"AI is writing (Temp: {self.temperature:.2f}, "
             f"Tokens: {self.token_limit})..."
         )
 
+        self._stop_worker(self.worker)
         self.worker = OllamaClient.generate_text(
             model=model,
             prompt=full_prompt,
@@ -357,20 +500,72 @@ class MainWindow(QMainWindow):
         self.worker.error.connect(self._on_error)
         self.worker.start()
 
+    def cancel_generation(self):
+        """Stop the in-progress generation, keeping any text received so far."""
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            self.toolbar.set_cancel_enabled(False)
+            self.statusBar.showMessage("Stopping generation...")
+
+    def _stop_worker(self, worker, timeout_ms: int = 100):
+        """Detach and cancel a running worker so it cannot deliver stale results.
+
+        Args:
+            worker: Worker to stop (ignored if None or already finished)
+            timeout_ms: How long to wait for the thread to exit
+        """
+        if worker is None or not worker.isRunning():
+            return
+
+        for signal in (
+            worker.models_loaded,
+            worker.text_chunk_received,
+            worker.finished,
+            worker.error,
+        ):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # Nothing connected
+
+        worker.cancel()
+        worker.wait(timeout_ms)
+
+    @pyqtSlot(str)
     def _on_text_chunk_received(self, chunk: str):
         """Handle real-time text chunk from generator."""
         cursor = self.editor.textCursor()
         cursor.movePosition(cursor.End)
-        
-        # Add space if needed for first chunk
-        if self.generation_cursor_pos == len(self.editor.toPlainText()):
-            text = self.editor.toPlainText()
-            if text and not text[-1].isspace() and chunk and not chunk[0].isspace():
-                cursor.insertText(" ")
-        
-        cursor.insertText(chunk)
-        self.editor.setTextCursor(cursor)
+
+        # The first chunk opens an edit block that later chunks join, so the
+        # whole completion is laid out per chunk once and undone in one step
+        if self._awaiting_first_chunk and chunk:
+            self._awaiting_first_chunk = False
+            sep = ""
+            if not self._last_char_was_space and not chunk[0].isspace():
+                sep = " "
+            cursor.beginEditBlock()
+            chunk = sep + chunk
+        else:
+            cursor.joinPreviousEditBlock()
+
+        # Editor signals stay quiet per chunk; listeners are told once when
+        # the stream ends (see _end_stream_insert)
+        self.editor.blockSignals(True)
+        try:
+            cursor.insertText(chunk)
+            cursor.endEditBlock()
+            self.editor.setTextCursor(cursor)
+        finally:
+            self.editor.blockSignals(False)
+        self._stream_inserted = True
         self.editor.ensureCursorVisible()
+
+    def _end_stream_insert(self):
+        """Emit the textChanged that streamed insertions held back."""
+        if self._stream_inserted:
+            self._stream_inserted = False
+            self.editor.textChanged.emit()
     
     def _prepare_prompt_for_generation(self, user_text: str) -> str:
         """Prepare the final prompt for generation.
@@ -381,32 +576,33 @@ class MainWindow(QMainWindow):
         Returns:
             Final prompt to send to the model
         """
-        # Get selected prompt template 
+        # The selector keeps the selected template's content at hand
         prompt_template = self.toolbar.get_prompt_selector().get_selected_prompt_content()
-        
-        if prompt_template and prompt_template.strip():
-            # Combine template with user text
-            return f"{prompt_template}\n\n{user_text}"
-        else:
+
+        if not prompt_template or prompt_template.isspace():
             # No template selected, use text directly
             return user_text
+        # Combine template with user text
+        return "".join((prompt_template, "\n\n", user_text))
         
     def _init_spell_checker(self):
         """Initialize the spell checker for the text editor."""
-        if SpellChecker.is_available() and self.settings.spell_check.enabled:
+        spell_check = self.settings.spell_check
+        if SpellChecker.is_available() and spell_check.enabled:
             self.spell_checker = SpellChecker(self.editor)
-            self.spell_checker.set_enabled(self.settings.spell_check.enabled)
-            self.spell_checker.set_dictionary(self.settings.spell_check.language)
+            self.spell_checker.set_enabled(spell_check.enabled)
+            self.spell_checker.set_dictionary(spell_check.language)
             
             # Set highlight color from settings
             from PyQt5.QtGui import QColor
-            color = QColor(self.settings.spell_check.highlight_color)
+            color = QColor(spell_check.highlight_color)
             self.spell_checker.set_highlight_color(color)
     
+    @pyqtSlot(bool)
     def _on_spell_check_toggled(self, enabled: bool):
         """Handle spell check enable/disable toggle."""
         self.settings.spell_check.enabled = enabled
-        save_settings()
+        self._schedule_settings_save()
         
         if self.spell_checker:
             self.spell_checker.set_enabled(enabled)
@@ -414,65 +610,113 @@ class MainWindow(QMainWindow):
             # Initialize spell checker if it wasn't created before
             self._init_spell_checker()
     
+    @pyqtSlot(str)
     def _on_spell_language_changed(self, language: str):
         """Handle spell check language change."""
         self.settings.spell_check.language = language
-        save_settings()
+        self._schedule_settings_save()
         
         if self.spell_checker:
             self.spell_checker.set_dictionary(language)
 
+    @pyqtSlot(str)
     def _on_generation_finished(self, completion: str):
         """Handle completion of text generation."""
-        self.statusBar.showMessage(
-            f"✓ Generation complete (Temp: {self.temperature:.2f}, "
-            f"Tokens: {self.token_limit})"
-        )
+        if self.worker.is_cancelled:
+            self.statusBar.showMessage("Generation stopped")
+        else:
+            self.statusBar.showMessage(
+                f"✓ Generation complete (Temp: {self.temperature:.2f}, "
+                f"Tokens: {self.token_limit})"
+            )
         self._reset_generate_button()
+        self._end_stream_insert()
         self._on_text_changed()
 
+    @pyqtSlot(str)
     def _on_error(self, error_msg: str):
         """Handle error during Ollama operations."""
         self.statusBar.showMessage("❌ Error")
         self._reset_generate_button()
+        self._end_stream_insert()
         QMessageBox.critical(self, "Error", error_msg)
 
     def _reset_generate_button(self):
         """Reset generate button to normal state."""
+        self.toolbar.set_cancel_enabled(False)
         self.toolbar.set_generate_enabled(True)
+        self._last_text_state = None
         self.toolbar.set_generate_text("✨ Generate")
 
+    def _schedule_settings_save(self):
+        """Save settings once the current burst of changes is over."""
+        # Restarting the timer pushes the write back
+        self._settings_save_timer.start()
+
     # File operations
     def _save_as_txt(self):
         """Save document as text file."""
-        text = self.editor.toPlainText()
-        path = self.file_manager.current_file
-        if path:
-            success = self.file_manager.save_as_txt(text, file_path=path)
-        else:
-            success = self.file_manager.save_as_txt(text)
-            
-        if success:
-            self.statusBar.showMessage(
-                f"✓ Saved to {self.file_manager.current_file_path}"
-            )
+        self._start_save("txt", self.file_manager.current_file)
 
     def _save_as_docx(self):
         """Save document as Word file."""
+        self._start_save("docx", self.file_manager.current_file)
+
+    def _start_save(self, fmt: str, file_path: str | None):
+        """Write the document to disk in a background thread.
+
+        Args:
+            fmt: File format, either "txt" or "docx"
+            file_path: Path to save to, or None to prompt the user
+        """
         text = self.editor.toPlainText()
-        path = self.file_manager.current_file
-        if path:
-            success = self.file_manager.save_as_docx(text, file_path=path)
-        else:
-            success = self.file_manager.save_as_docx(text)
-            
-        if success:
-            self.statusBar.showMessage(
-                f"✓ Saved to {self.file_manager.current_file_path}"
-            )
+        worker = self.file_manager.save_in_background(text, fmt, file_path)
+        if worker is None:
+            return
+
+        # FileManager reports failures itself
+        worker.done.connect(self._on_save_finished)
+        worker.error.connect(self._on_save_failed)
+        self.statusBar.showMessage("Saving...")
+        self._queued_saves.append(worker)
+        if self.save_worker is None:
+            self._start_next_save()
+
+    def _start_next_save(self):
+        """Start the oldest queued save, if any."""
+        self.save_worker = self._queued_saves.pop(0) if self._queued_saves else None
+        if self.save_worker is not None:
+            self.save_worker.start()
+
+    @pyqtSlot(str)
+    def _on_save_finished(self, file_path: str):
+        """Handle completion of a background save."""
+        self.statusBar.showMessage(f"✓ Saved to {file_path}")
+        self._start_next_save()
+
+    @pyqtSlot(str)
+    def _on_save_failed(self, error_msg: str):
+        """Move on to the next queued save after a failed one."""
+        self.statusBar.clearMessage()
+        self._start_next_save()
 
     def closeEvent(self, event):
         """Handle application close event."""
-        # Save settings before closing
+        # Save settings before closing, including any pending delayed save
+        self._settings_save_timer.stop()
         save_settings()
+
+        # Stop background requests so the process exits cleanly
+        self._warmup_timer.stop()
+        for worker in (self.worker, self.scan_worker):
+            self._stop_worker(worker, timeout_ms=2000)
+        # A sent warm-up cannot be interrupted, so it is not waited for
+        if self.warmup_worker is not None:
+            self.warmup_worker.cancel()
+        OllamaClient.shutdown()
+
+        # Let running and queued saves finish, so no file is left half written
+        while self.save_worker is not None:
+            self.save_worker.wait()
+            self._start_next_save()
         event.accept()
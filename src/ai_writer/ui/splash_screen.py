@@ -67,46 +67,19 @@ class SplashScreen(QSplashScreen):
         layout.setSpacing(20)
         layout.setContentsMargins(40, 40, 40, 40)
         
-        # Application title
-        title_label = QLabel("AI Writer")
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 32px;
-                font-weight: bold;
-                background: transparent;
-                border: none;
-            }
-        """)
-        layout.addWidget(title_label)
-        
-        # Version label
-        version_label = QLabel("Version 0.3.1")
-        version_label.setAlignment(Qt.AlignCenter)
-        version_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 180);
-                font-size: 14px;
-                background: transparent;
-                border: none;
-            }
-        """)
-        layout.addWidget(version_label)
-        
-        # Description
-        desc_label = QLabel("AI-Powered Writing Assistant")
-        desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 160);
-                font-size: 16px;
-                font-style: italic;
-                background: transparent;
-                border: none;
-            }
-        """)
-        layout.addWidget(desc_label)
+        # Title, version and description share one rich-text label
+        header_label = QLabel(
+            '<div style="color: white; font-size: 32px; font-weight: bold;">'
+            "AI Writer</div>"
+            '<div style="color: rgba(255, 255, 255, 180); font-size: 14px;">'
+            "Version 0.3.1</div><br>"
+            '<div style="color: rgba(255, 255, 255, 160); font-size: 16px;'
+            ' font-style: italic;">AI-Powered Writing Assistant</div>'
+        )
+        header_label.setTextFormat(Qt.RichText)
+        header_label.setAlignment(Qt.AlignCenter)
+        header_label.setStyleSheet("QLabel { background: transparent; border: none; }")
+        layout.addWidget(header_label)
         
         # Progress bar
         self.progress_bar = QProgressBar()
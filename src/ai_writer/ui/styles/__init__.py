@@ -1,6 +1,13 @@
 """Styling and theme management."""
 
+from ai_writer.ui.styles.base_theme import build_themed_stylesheet
 from ai_writer.ui.styles.dark_theme import DARK_THEME
 from ai_writer.ui.styles.light_theme import LIGHT_THEME
 
-__all__ = ["DARK_THEME", "LIGHT_THEME"]
+# Pre-rendered stylesheets keyed by theme name
+STYLES = {"light": LIGHT_THEME, "dark": DARK_THEME}
+
+# One stylesheet for all themes, selected by the main window's "theme" property
+THEMED_STYLESHEET = build_themed_stylesheet(STYLES)
+
+__all__ = ["DARK_THEME", "LIGHT_THEME", "STYLES", "THEMED_STYLESHEET"]
@@ -0,0 +1,154 @@
+"""Shared stylesheet template for AI Writer themes.
+
+Both themes use the same QSS rules and differ only in their colours, so each
+theme module supplies a palette that is substituted into this template once at
+import time.
+"""
+
+import re
+import sys
+from string import Template
+
+if sys.platform == "darwin":
+    PLATFORM_FONT = "'San Francisco', 'Helvetica Neue', 'Arial', sans-serif"
+elif sys.platform == "win32":
+    PLATFORM_FONT = "'Segoe UI', 'Arial', sans-serif"
+else:
+    PLATFORM_FONT = "'Ubuntu', 'Segoe UI', 'Arial', sans-serif"
+
+_BASE_QSS = Template("""
+QMainWindow { background-color: $window_bg; }
+QWidget { font-family: $font; color: $fg; }
+
+QToolBar {
+    background-color: $panel_bg;
+    border-bottom: 1px solid $border;
+    padding: 8px;
+    spacing: 10px;
+}
+QToolBar QPushButton {
+    background-color: transparent;
+    border: 1px solid $button_border;
+    border-radius: 6px;
+    padding: 8px 15px;
+    font-weight: 500;
+    color: $fg;
+}
+QToolBar QPushButton:hover { background-color: $button_hover; }
+QToolBar QPushButton:disabled { color: $disabled_fg; border-color: $disabled_border; }
+
+QToolBar QPushButton#generate-btn {
+    background-color: $accent;
+    color: white;
+    border: none;
+    font-weight: 600;
+}
+QToolBar QPushButton#generate-btn:hover { background-color: $accent_hover; }
+
+QTextEdit#editor {
+    background-color: $editor_bg;
+    border: none;
+    border-radius: 0px;
+    padding: 40px;
+    font-size: 16px;
+    line-height: 1.6;
+    font-family: 'Georgia', 'Times New Roman', serif;
+    color: $editor_fg;
+}
+QTextEdit#editor:focus { outline: none; }
+
+QFrame#sidebar {
+    background-color: $panel_bg;
+    border-left: 1px solid $border;
+    padding: 20px;
+}
+
+QComboBox, QSpinBox {
+    background-color: $input_bg;
+    border: 1px solid $button_border;
+    border-radius: 6px;
+    padding: 8px;
+    font-size: 13px;
+    color: $input_fg;
+}
+QComboBox:focus, QSpinBox:focus { border: 1px solid $accent; }
+
+QSlider::groove:horizontal {
+    border: 1px solid $button_border;
+    height: 6px;
+    background: $slider_groove;
+    border-radius: 3px;
+}
+QSlider::handle:horizontal {
+    background: $accent;
+    border: 1px solid #0056b3;
+    width: 16px;
+    margin: -5px 0;
+    border-radius: 8px;
+}
+QSlider::handle:horizontal:hover { background: $accent_hover; }
+
+QLabel#sidebar-title {
+    font-size: 14px;
+    font-weight: 600;
+    color: $sidebar_title;
+    margin: 10px 0;
+}
+
+QStatusBar { background-color: $panel_bg; border-top: 1px solid $border; color: #888; }
+
+QPushButton#save-btn {
+    background-color: #34c759;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 8px 15px;
+    font-weight: 500;
+    margin: 5px 0;
+}
+QPushButton#save-btn:hover { background-color: #28a745; }
+QPushButton#save-btn:disabled { background-color: $save_disabled_bg; }
+""")
+
+
+def build_stylesheet(palette: dict[str, str]) -> str:
+    """Render the shared stylesheet template with a theme palette.
+
+    Args:
+        palette: Mapping of template placeholder names to colours
+
+    Returns:
+        Complete QSS stylesheet for the theme
+    """
+    return _BASE_QSS.substitute(palette, font=PLATFORM_FONT)
+
+
+_RULE_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+
+
+def build_themed_stylesheet(themes: dict[str, str]) -> str:
+    """Combine several theme stylesheets into one keyed on a dynamic property.
+
+    Every selector is scoped to ``QMainWindow[theme="<name>"]``, so switching
+    themes only needs the window's ``theme`` property changed and its widgets
+    re-polished, instead of a new stylesheet being parsed.
+
+    Args:
+        themes: Mapping of theme name to its rendered stylesheet
+
+    Returns:
+        Single stylesheet covering all themes
+    """
+    rules = []
+    for name, qss in themes.items():
+        scope = f'QMainWindow[theme="{name}"]'
+        for selectors, body in _RULE_RE.findall(qss):
+            scoped = []
+            for selector in selectors.split(","):
+                selector = selector.strip()
+                if selector.startswith("QMainWindow"):
+                    scoped.append(scope + selector[len("QMainWindow") :])
+                else:
+                    scoped.append(f"{scope} {selector}")
+            rules.append(f"{', '.join(scoped)} {{{body}}}")
+    return "\n".join(rules)
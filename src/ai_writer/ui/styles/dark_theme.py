@@ -1,99 +1,25 @@
 """Dark theme stylesheet for AI Writer."""
 
-import sys
-
-if sys.platform == "darwin":
-    PLATFORM_FONT = "'San Francisco', 'Helvetica Neue', 'Arial', sans-serif"
-elif sys.platform == "win32":
-    PLATFORM_FONT = "'Segoe UI', 'Arial', sans-serif"
-else:
-    PLATFORM_FONT = "'Ubuntu', 'Segoe UI', 'Arial', sans-serif"
-
-DARK_THEME = """
-QMainWindow { background-color: #1e1e1e; }
-QWidget { font-family: __PLATFORM_FONT__; color: #e0e0e0; }
-
-QToolBar {
-    background-color: #2c2c2c;
-    border-bottom: 1px solid #3a3a3a;
-    padding: 8px;
-    spacing: 10px;
-}
-QToolBar QPushButton {
-    background-color: transparent;
-    border: 1px solid #444;
-    border-radius: 6px;
-    padding: 8px 15px;
-    font-weight: 500;
-    color: #e0e0e0;
-}
-QToolBar QPushButton:hover { background-color: #3a3a3a; }
-QToolBar QPushButton:disabled { color: #555; border-color: #333; }
-
-QToolBar QPushButton#generate-btn {
-    background-color: #0a84ff;
-    color: white;
-    border: none;
-    font-weight: 600;
-}
-QToolBar QPushButton#generate-btn:hover { background-color: #409cff; }
-
-QTextEdit#editor {
-    background-color: #252526;
-    border: none;
-    border-radius: 0px;
-    padding: 40px;
-    font-size: 16px;
-    line-height: 1.6;
-    font-family: 'Georgia', 'Times New Roman', serif;
-    color: #d4d4d4;
-}
-QTextEdit#editor:focus { outline: none; }
-
-QFrame#sidebar {
-    background-color: #2c2c2c;
-    border-left: 1px solid #3a3a3a;
-    padding: 20px;
-}
-
-QComboBox, QSpinBox {
-    background-color: #3a3a3a;
-    border: 1px solid #444;
-    border-radius: 6px;
-    padding: 8px;
-    font-size: 13px;
-    color: #fff;
-}
-QComboBox:focus, QSpinBox:focus { border: 1px solid #0a84ff; }
-
-QSlider::groove:horizontal {
-    border: 1px solid #444;
-    height: 6px;
-    background: #3a3a3a;
-    border-radius: 3px;
-}
-QSlider::handle:horizontal {
-    background: #0a84ff;
-    border: 1px solid #0056b3;
-    width: 16px;
-    margin: -5px 0;
-    border-radius: 8px;
-}
-QSlider::handle:horizontal:hover { background: #409cff; }
-
-QLabel#sidebar-title { font-size: 14px; font-weight: 600; color: #aaa; margin: 10px 0; }
-
-QStatusBar { background-color: #2c2c2c; border-top: 1px solid #3a3a3a; color: #888; }
-
-QPushButton#save-btn {
-    background-color: #34c759;
-    color: white;
-    border: none;
-    border-radius: 6px;
-    padding: 8px 15px;
-    font-weight: 500;
-    margin: 5px 0;
-}
-QPushButton#save-btn:hover { background-color: #28a745; }
-QPushButton#save-btn:disabled { background-color: #555; }
-""".replace("__PLATFORM_FONT__", PLATFORM_FONT)
+from ai_writer.ui.styles.base_theme import build_stylesheet
+
+DARK_PALETTE = {
+    "window_bg": "#1e1e1e",
+    "fg": "#e0e0e0",
+    "panel_bg": "#2c2c2c",
+    "border": "#3a3a3a",
+    "button_border": "#444",
+    "button_hover": "#3a3a3a",
+    "disabled_fg": "#555",
+    "disabled_border": "#333",
+    "accent": "#0a84ff",
+    "accent_hover": "#409cff",
+    "editor_bg": "#252526",
+    "editor_fg": "#d4d4d4",
+    "input_bg": "#3a3a3a",
+    "input_fg": "#fff",
+    "slider_groove": "#3a3a3a",
+    "sidebar_title": "#aaa",
+    "save_disabled_bg": "#555",
+}
+
+DARK_THEME = build_stylesheet(DARK_PALETTE)
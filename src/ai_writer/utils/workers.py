@@ -0,0 +1,87 @@
+"""Background worker support for AI Writer.
+
+Workers run on a shared thread pool whose threads stay alive for the lifetime
+of the application, so starting a task does not create a new OS thread.
+"""
+
+import threading
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool
+
+# Upper bound on concurrently running background tasks
+MAX_POOL_THREADS = 4
+
+_pool: QThreadPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_thread_pool() -> QThreadPool:
+    """Get the shared thread pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = QThreadPool()
+            _pool.setMaxThreadCount(MAX_POOL_THREADS)
+            _pool.setExpiryTimeout(-1)  # Keep idle threads around
+        return _pool
+
+
+class _WorkerRunnable(QRunnable):
+    """Adapter that executes a BackgroundWorker on the thread pool."""
+
+    def __init__(self, worker: "BackgroundWorker"):
+        super().__init__()
+        self.worker = worker
+
+    def run(self) -> None:
+        self.worker._execute()
+
+
+class BackgroundWorker(QObject):
+    """Base class for tasks executed on the shared thread pool.
+
+    Subclasses implement run() and declare their own signals. The start,
+    isRunning and wait methods mirror QThread so callers can treat a worker
+    like a thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the worker in the idle state."""
+        super().__init__()
+        self._idle = threading.Event()
+        self._idle.set()
+
+    def start(self, pool: QThreadPool | None = None) -> None:
+        """Queue the worker on a thread pool.
+
+        Args:
+            pool: Pool to run on (None uses the shared pool)
+        """
+        self._idle.clear()
+        (pool or get_thread_pool()).start(_WorkerRunnable(self))
+
+    def isRunning(self) -> bool:
+        """Check whether the worker has been started and not yet finished."""
+        return not self._idle.is_set()
+
+    def wait(self, msecs: int | None = None) -> bool:
+        """Block until the worker finishes.
+
+        Args:
+            msecs: Maximum time to wait in milliseconds (None waits forever)
+
+        Returns:
+            True if the worker finished, False if the wait timed out
+        """
+        return self._idle.wait(None if msecs is None else msecs / 1000)
+
+    def run(self) -> None:
+        """Execute the background task."""
+        raise NotImplementedError
+
+    def _execute(self) -> None:
+        """Run the task on a pool thread and mark the worker idle afterwards."""
+        try:
+            self.run()
+        finally:
+            self._idle.set()
@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from ai_writer.core.file_manager import FileManager
+from ai_writer.core.file_manager import FileManager, FileWriteWorker
 
 
 class TestFileManager:
@@ -66,6 +66,38 @@ class TestFileManager:
         result = self.file_manager.save_as_txt("")
         assert result is False
 
+    def test_file_write_worker_writes_txt(self):
+        """Test that the background worker writes the text to disk."""
+        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
+            try:
+                worker = FileWriteWorker(f.name, self.test_text, "txt")
+                worker.done = Mock()
+                worker.error = Mock()
+
+                worker.run()
+
+                worker.done.emit.assert_called_once_with(f.name)
+                worker.error.emit.assert_not_called()
+                assert Path(f.name).read_text(encoding="utf-8") == self.test_text
+            finally:
+                Path(f.name).unlink(missing_ok=True)
+
+    def test_file_write_worker_runs_on_pool(self):
+        """Test that the write worker runs as a pooled background task."""
+        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
+            try:
+                worker = FileWriteWorker(f.name, self.test_text, "txt")
+                worker.start()
+
+                assert worker.wait(5000)
+                assert Path(f.name).read_text(encoding="utf-8") == self.test_text
+            finally:
+                Path(f.name).unlink(missing_ok=True)
+
+    def test_save_in_background_empty_text(self):
+        """Test that a background save of empty text is aborted."""
+        assert self.file_manager.save_in_background("", "txt", "unused.txt") is None
+
     def test_load_txt_file(self):
         """Test loading TXT file."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
@@ -4,35 +4,145 @@ from unittest.mock import Mock, patch
 
 import pytest
 import requests
+from PyQt5.QtCore import QThread
 
-from ai_writer.core.ollama_client import OllamaAPI, OllamaClient, OllamaWorker
+from ai_writer.core.ollama_api import (
+    OllamaAPI,
+    _iter_records,
+    _parse_stream_line,
+    load_cached_models,
+    save_cached_models,
+    trim_context,
+)
+from ai_writer.core.ollama_client import OllamaClient, OllamaWorker
+from ai_writer.utils.workers import BackgroundWorker
+
+
+class TestTrimContext:
+    """Test trim_context helper."""
+
+    def test_short_text_unchanged(self):
+        """Test that text within the limit is returned as is."""
+        assert trim_context("Short text", 100) == "Short text"
+
+    def test_long_text_is_trimmed(self):
+        """Test that only the tail of long text is kept."""
+        text = "a" * 200
+        assert trim_context(text, 100) == "a" * 100
+
+    def test_cut_snaps_to_paragraph_break(self):
+        """Test that the cut moves back to a nearby paragraph break."""
+        text = "x" * 90 + "\n\n" + "First para." + "y" * 97
+        trimmed = trim_context(text, 100)
+        assert trimmed.startswith("First para.")
+
+
+class TestIterRecords:
+    """Test _iter_records helper."""
+
+    def test_records_split_across_chunks(self):
+        """Test that records are rejoined across chunk boundaries."""
+        chunks = [b'{"a":1}\n{"b"', b':2}\n\n{"c":3}']
+        assert list(_iter_records(chunks)) == [b'{"a":1}', b'{"b":2}', b'{"c":3}']
+
+
+class TestParseStreamLine:
+    """Test _parse_stream_line helper."""
+
+    def test_plain_text_record(self):
+        """Test that unescaped text is read without a full parse."""
+        line = b'{"model":"m","response":" the","done":false}'
+        assert _parse_stream_line(line) == (" the", False)
+
+    def test_escaped_text_record(self):
+        """Test that escaped text falls back to JSON decoding."""
+        line = b'{"model":"m","response":"say \\"hi\\"\\n","done":false}'
+        assert _parse_stream_line(line) == ('say "hi"\n', False)
+
+    def test_spaced_record(self):
+        """Test that non-compact JSON is still understood."""
+        assert _parse_stream_line(b'{"response": "x", "done": true}') == ("x", True)
+
+
+class TestModelsCache:
+    """Test the persisted model list."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that saved models are loaded back for the same server."""
+        with patch(
+            "ai_writer.core.ollama_api.MODELS_CACHE_PATH", tmp_path / "models.json"
+        ):
+            save_cached_models("http://localhost:11434", ["model1", "model2"])
+
+            assert load_cached_models("http://localhost:11434") == ["model1", "model2"]
+            assert load_cached_models("http://other:11434") == []
+
+    def test_missing_or_corrupt_file(self, tmp_path):
+        """Test that an unreadable cache file yields no models."""
+        cache_path = tmp_path / "models.json"
+        with patch("ai_writer.core.ollama_api.MODELS_CACHE_PATH", cache_path):
+            assert load_cached_models("http://localhost:11434") == []
+
+            cache_path.write_text("not json")
+            assert load_cached_models("http://localhost:11434") == []
 
 
 class TestOllamaAPI:
     """Test OllamaAPI class."""
 
+    def setup_method(self):
+        """Start every test with an empty model list cache."""
+        OllamaAPI.clear_models_cache()
+
     def test_init(self):
         """Test initialization of OllamaAPI."""
         api = OllamaAPI(url="http://test:11434")
         assert api.url == "http://test:11434"
         assert api.timeout == 10
 
-    @patch("ai_writer.core.ollama_client.requests.get")
-    def test_scan_models_success(self, mock_get):
+    def test_session_is_shared(self):
+        """Test that API instances reuse one pooled HTTP session."""
+        first = OllamaAPI(url="http://test")
+        second = OllamaAPI(url="http://other")
+        assert first.session is second.session
+        assert isinstance(first.session, requests.Session)
+
+    def test_close_session(self):
+        """Test that closing the shared session creates a fresh one next time."""
+        session = OllamaAPI.get_session()
+        OllamaAPI.close_session()
+        assert OllamaAPI.get_session() is not session
+
+    def test_scan_models_success(self):
         """Test successful model scanning in API."""
+        mock_session = Mock()
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "models": [{"name": "llama2:latest"}, {"name": "codellama:13b"}]
-        }
-        mock_get.return_value = mock_response
+        mock_response.content = (
+            b'{"models": [{"name": "llama2:latest"}, {"name": "codellama:13b"}]}'
+        )
+        mock_session.get.return_value = mock_response
 
-        api = OllamaAPI(url="http://test")
+        api = OllamaAPI(url="http://test", session=mock_session)
         models = api.scan_models()
         assert models == ["llama2:latest", "codellama:13b"]
 
-    @patch("ai_writer.core.ollama_client.requests.post")
-    def test_generate_text_stream(self, mock_post):
+    def test_scan_models_uses_cache(self):
+        """Test that a recent model list is reused unless a refresh is forced."""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.content = b'{"models": [{"name": "llama2:latest"}]}'
+        mock_session.get.return_value = mock_response
+
+        api = OllamaAPI(url="http://test", session=mock_session)
+        assert api.scan_models() == ["llama2:latest"]
+        assert api.scan_models() == ["llama2:latest"]
+        assert mock_session.get.call_count == 1
+
+        api.scan_models(force_refresh=True)
+        assert mock_session.get.call_count == 2
+
+    def test_generate_text_stream(self):
         """Test streaming text generation in API."""
         mock_response = Mock()
         mock_response.status_code = 200
@@ -42,22 +152,41 @@ class TestOllamaAPI:
             {"response": " the", "done": False},
             {"response": " continuation.", "done": True}
         ]
-        mock_response.iter_lines.return_value = [json.dumps(c).encode("utf-8") for c in chunks]
-        mock_post.return_value = mock_response
+        mock_response.iter_content.return_value = [
+            json.dumps(c).encode("utf-8") + b"\n" for c in chunks
+        ]
+        mock_session = Mock()
+        mock_session.post.return_value = mock_response
 
-        api = OllamaAPI(url="http://test")
+        api = OllamaAPI(url="http://test", session=mock_session)
         result_chunks = list(api.generate_text_stream("model", "Start", 0.7, 50))
         assert result_chunks == ["This is", " the", " continuation."]
 
-    @patch("ai_writer.core.ollama_client.requests.post")
-    def test_generate_text_batch(self, mock_post):
+    def test_generate_text_stream_stops_at_final_record(self):
+        """Test that the final stats record ends the stream without parsing."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [
+            b'{"response":"Once","done":false}\n',
+            b'{"response":"","done":true,"context":[1,2,3]}\n',
+            b'not json\n',
+        ]
+        mock_session = Mock()
+        mock_session.post.return_value = mock_response
+
+        api = OllamaAPI(url="http://test", session=mock_session)
+        result_chunks = list(api.generate_text_stream("model", "Start", 0.7, 50))
+        assert result_chunks == ["Once"]
+
+    def test_generate_text_batch(self):
         """Test batch text generation in API."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"response": "This is the continuation."}
-        mock_post.return_value = mock_response
+        mock_response.content = b'{"response": "This is the continuation."}'
+        mock_session = Mock()
+        mock_session.post.return_value = mock_response
 
-        api = OllamaAPI(url="http://test")
+        api = OllamaAPI(url="http://test", session=mock_session)
         result = api.generate_text("model", "Start", 0.7, 50)
         assert result == "This is the continuation."
 
@@ -75,6 +204,22 @@ class TestOllamaAPI:
         cleaned = OllamaAPI.clean_completion(original, completion)
         assert cleaned == "and this is more text."
 
+    def test_clean_completion_prefix_is_case_insensitive(self):
+        """Test that prefixes are removed regardless of case."""
+        cleaned = OllamaAPI.clean_completion("Start", "COMPLETION:   the rest")
+        assert cleaned == "the rest"
+
+    def test_clean_completion_removes_chained_prefixes(self):
+        """Test that several prefixes in a row are all removed."""
+        completion = "Here's the continuation: Continued: the rest"
+        cleaned = OllamaAPI.clean_completion("Start", completion)
+        assert cleaned == "the rest"
+
+    def test_clean_completion_leaves_plain_text(self):
+        """Test that text needing no cleanup is only stripped."""
+        cleaned = OllamaAPI.clean_completion("Once upon", "  a time there was  ")
+        assert cleaned == "a time there was"
+
     def test_clean_completion_handles_quotes(self):
         """Test that completion cleaning handles quotes correctly."""
         original = "He said"
@@ -86,6 +231,10 @@ class TestOllamaAPI:
 class TestOllamaWorker:
     """Test OllamaWorker class."""
 
+    def setup_method(self):
+        """Start each test with an empty response cache."""
+        OllamaWorker.clear_response_cache()
+
     def test_init_scan_endpoint(self):
         """Test initialization for model scanning."""
         worker = OllamaWorker(endpoint="scan")
@@ -123,6 +272,29 @@ class TestOllamaWorker:
         worker.models_loaded.emit.assert_called_once_with(["model1", "model2"])
         worker.error.emit.assert_not_called()
 
+    @patch("ai_writer.core.ollama_client.get_settings")
+    @patch("ai_writer.core.ollama_client.OllamaAPI")
+    def test_settings_resolved_once(self, mock_api_class, mock_get_settings):
+        """Test that settings and the API client are created when the worker is."""
+        worker = OllamaWorker(endpoint="scan")
+        worker.models_loaded = Mock()
+        worker.error = Mock()
+
+        worker.run()
+        mock_get_settings.assert_called_once()
+        mock_api_class.assert_called_once()
+
+    @patch("ai_writer.core.ollama_client.get_settings")
+    def test_worker_uses_configured_timeout(self, mock_get_settings):
+        """Test that workers honour the configured URL and timeout."""
+        mock_get_settings.return_value.ollama.url = "http://ollama:11434"
+        mock_get_settings.return_value.ollama.timeout = 42
+
+        for endpoint in ("scan", "generate", "warmup"):
+            worker = OllamaWorker(endpoint=endpoint)
+            assert worker._api.url == "http://ollama:11434"
+            assert worker._api.timeout == 42
+
     @patch("ai_writer.core.ollama_client.get_settings")
     @patch("ai_writer.core.ollama_client.OllamaAPI")
     def test_scan_models_failure(self, mock_api_class, mock_get_settings):
@@ -167,6 +339,141 @@ class TestOllamaWorker:
         worker.error.emit.assert_not_called()
 
 
+    @patch("ai_writer.core.ollama_client.time.monotonic", return_value=100.0)
+    @patch("ai_writer.core.ollama_client.get_settings")
+    @patch("ai_writer.core.ollama_client.OllamaAPI")
+    def test_generate_text_coalesces_chunks(
+        self, mock_api_class, mock_settings, mock_monotonic
+    ):
+        """Test that rapid small chunks are emitted in batches."""
+        mock_api = mock_api_class.return_value
+        mock_api.generate_text_stream.return_value = iter(["a"] * 10)
+
+        worker = OllamaWorker(
+            endpoint="generate",
+            model="llama2",
+            prompt="Start",
+            temperature=0.7,
+            token_limit=100,
+            stream=True
+        )
+        worker.text_chunk_received = Mock()
+        worker.finished = Mock()
+        worker.error = Mock()
+
+        worker.run()
+
+        emitted = [c.args[0] for c in worker.text_chunk_received.emit.call_args_list]
+        assert emitted == ["a", "a" * 9]
+        worker.finished.emit.assert_called_once_with("a" * 10)
+
+    @patch("ai_writer.core.ollama_client.get_settings")
+    @patch("ai_writer.core.ollama_client.OllamaAPI")
+    def test_generate_text_cancel_stops_stream(self, mock_api_class, mock_settings):
+        """Test that cancelling stops streaming and keeps the partial text."""
+        def fake_stream(**kwargs):
+            yield "chunk1"
+            yield "chunk2"
+            yield "chunk3"
+
+        mock_api = mock_api_class.return_value
+        mock_api.generate_text_stream.side_effect = fake_stream
+
+        worker = OllamaWorker(
+            endpoint="generate",
+            model="llama2",
+            prompt="Start",
+            temperature=0.7,
+            token_limit=100,
+            stream=True
+        )
+        worker.text_chunk_received = Mock()
+        worker.text_chunk_received.emit.side_effect = lambda chunk: worker.cancel()
+        worker.finished = Mock()
+        worker.error = Mock()
+
+        worker.run()
+
+        assert worker.is_cancelled
+        worker.text_chunk_received.emit.assert_called_once_with("chunk1")
+        worker.finished.emit.assert_called_once_with("chunk1")
+        worker.error.emit.assert_not_called()
+
+
+    @patch("ai_writer.core.ollama_client.get_settings")
+    @patch("ai_writer.core.ollama_client.OllamaAPI")
+    def test_cancelled_warm_up_sends_no_request(self, mock_api_class, mock_settings):
+        """Test that a warm-up cancelled before it runs is skipped."""
+        worker = OllamaWorker(endpoint="warmup", model="llama2")
+        worker.cancel()
+
+        worker.run()
+
+        mock_api_class.return_value.warm_up.assert_not_called()
+
+    @patch("ai_writer.core.ollama_client.get_settings")
+    @patch("ai_writer.core.ollama_client.OllamaAPI")
+    def test_warm_up_runs_on_own_pool(self, mock_api_class, mock_settings):
+        """Test that warm-ups do not take a slot of the shared pool."""
+        with patch(
+            "ai_writer.core.ollama_client._get_warmup_pool"
+        ) as mock_warmup_pool, patch(
+            "ai_writer.utils.workers.get_thread_pool"
+        ) as mock_shared_pool:
+            OllamaWorker(endpoint="warmup", model="llama2").start()
+            OllamaWorker(endpoint="scan").start()
+
+        mock_warmup_pool.return_value.start.assert_called_once()
+        mock_shared_pool.return_value.start.assert_called_once()
+
+    @patch("ai_writer.core.ollama_client.get_settings")
+    @patch("ai_writer.core.ollama_client.OllamaAPI")
+    def test_generate_text_uses_response_cache(self, mock_api_class, mock_settings):
+        """Test that an identical request is served from the response cache."""
+        mock_api = mock_api_class.return_value
+        mock_api.generate_text.return_value = "cached text"
+
+        for _ in range(2):
+            worker = OllamaWorker(
+                endpoint="generate",
+                model="llama2",
+                prompt="Start",
+                temperature=0.5,
+                token_limit=100,
+                stream=False
+            )
+            worker.finished = Mock()
+            worker.error = Mock()
+            worker.run()
+            worker.finished.emit.assert_called_once_with("cached text")
+
+        mock_api.generate_text.assert_called_once()
+
+    @patch("ai_writer.core.ollama_client.get_settings")
+    @patch("ai_writer.core.ollama_client.OllamaAPI")
+    def test_generate_text_skips_cache_at_high_temperature(
+        self, mock_api_class, mock_settings
+    ):
+        """Test that high-temperature requests always reach the model."""
+        mock_api = mock_api_class.return_value
+        mock_api.generate_text.return_value = "fresh text"
+
+        for _ in range(2):
+            worker = OllamaWorker(
+                endpoint="generate",
+                model="llama2",
+                prompt="Start",
+                temperature=1.2,
+                token_limit=100,
+                stream=False
+            )
+            worker.finished = Mock()
+            worker.error = Mock()
+            worker.run()
+
+        assert mock_api.generate_text.call_count == 2
+
+
 class TestOllamaClient:
     """Test OllamaClient static methods."""
 
@@ -175,6 +482,25 @@ class TestOllamaClient:
         worker = OllamaClient.scan_models()
         assert isinstance(worker, OllamaWorker)
         assert worker.endpoint == "scan"
+        assert worker.force_refresh is False
+
+    def test_invalidate_model_cache(self):
+        """Test that invalidating forces the next scan to hit the server."""
+        mock_session = Mock()
+        mock_session.get.return_value.content = b'{"models": []}'
+        api = OllamaAPI(url="http://invalidate", session=mock_session)
+
+        api.scan_models()
+        OllamaClient.invalidate_model_cache()
+        api.scan_models()
+        assert mock_session.get.call_count == 2
+
+    def test_scan_models_runs_on_shared_pool(self):
+        """Test that scans are pooled tasks rather than dedicated threads."""
+        worker = OllamaClient.scan_models(force_refresh=True)
+        assert isinstance(worker, BackgroundWorker)
+        assert not isinstance(worker, QThread)
+        assert worker.force_refresh is True
 
     def test_generate_text_returns_worker(self):
         """Test that generate_text returns an OllamaWorker."""
@@ -188,6 +514,13 @@ class TestOllamaClient:
         assert worker.temperature == 0.5
         assert worker.token_limit == 200
 
+    def test_warm_up_model_returns_worker(self):
+        """Test that warm_up_model returns a warm-up OllamaWorker."""
+        worker = OllamaClient.warm_up_model("test-model")
+        assert isinstance(worker, OllamaWorker)
+        assert worker.endpoint == "warmup"
+        assert worker.model == "test-model"
+
     def test_generate_text_with_defaults(self):
         """Test generate_text with default parameters."""
         worker = OllamaClient.generate_text(model="test-model", prompt="test prompt")
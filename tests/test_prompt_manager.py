@@ -0,0 +1,101 @@
+"""Test prompt management."""
+
+from unittest.mock import patch
+
+import pytest
+
+from ai_writer.config.settings import Settings
+from ai_writer.core.prompt_manager import PromptManager
+
+
+@pytest.fixture
+def mock_save():
+    """Patch the settings write used by the prompt manager."""
+    with patch("ai_writer.core.prompt_manager.save_settings") as mock:
+        yield mock
+
+
+@pytest.fixture
+def manager(mock_save):
+    """Create a PromptManager on fresh, unsaved settings."""
+    with patch("ai_writer.core.prompt_manager.get_settings", return_value=Settings()):
+        yield PromptManager()
+
+
+class TestPromptsForModel:
+    """Test the per-model prompt lists."""
+
+    def test_returns_copy(self, manager):
+        """Test that changing a returned list does not affect later calls."""
+        prompt = manager.create_prompt("Shared", "Content")
+
+        prompts = manager.get_prompts_for_model("llama2")
+        prompts.clear()
+
+        assert prompt in manager.get_prompts_for_model("llama2")
+
+    def test_create_invalidates(self, manager):
+        """Test that a new prompt shows up in an already listed model."""
+        before = manager.get_prompts_for_model("llama2")
+
+        prompt = manager.create_prompt("New", "Content", language_model="llama2")
+
+        assert prompt not in before
+        assert prompt in manager.get_prompts_for_model("llama2")
+
+    def test_language_model_update_invalidates(self, manager):
+        """Test that moving a prompt to another model updates both lists."""
+        prompt = manager.create_prompt("Moved", "Content", language_model="llama2")
+        assert prompt in manager.get_prompts_for_model("llama2")
+        assert prompt not in manager.get_prompts_for_model("mistral")
+
+        manager.update_prompt(prompt.id, language_model="mistral")
+
+        assert prompt not in manager.get_prompts_for_model("llama2")
+        assert prompt in manager.get_prompts_for_model("mistral")
+
+    def test_delete_invalidates(self, manager):
+        """Test that a deleted prompt disappears from listed models."""
+        prompt = manager.create_prompt("Gone", "Content", language_model="llama2")
+        assert prompt in manager.get_prompts_for_model("llama2")
+
+        manager.delete_prompt(prompt.id)
+
+        assert prompt not in manager.get_prompts_for_model("llama2")
+
+
+class TestBatch:
+    """Test grouping changes into one settings write."""
+
+    def test_change_outside_batch_saves_immediately(self, manager, mock_save):
+        """Test that a single change is saved right away."""
+        manager.create_prompt("One", "Content")
+
+        mock_save.assert_called_once()
+
+    def test_batch_saves_once(self, manager, mock_save):
+        """Test that several changes in a batch are saved together."""
+        with manager.batch():
+            first = manager.create_prompt("One", "Content")
+            manager.create_prompt("Two", "Content")
+            manager.update_prompt(first.id, name="First")
+            mock_save.assert_not_called()
+
+        mock_save.assert_called_once()
+
+    def test_nested_batch_saves_once(self, manager, mock_save):
+        """Test that only the outermost batch writes the settings."""
+        with manager.batch():
+            with manager.batch():
+                manager.create_prompt("One", "Content")
+            mock_save.assert_not_called()
+            manager.create_prompt("Two", "Content")
+
+        mock_save.assert_called_once()
+
+    def test_empty_batch_does_not_save(self, manager, mock_save):
+        """Test that a batch without changes writes nothing."""
+        with manager.batch():
+            manager.get_all_prompts()
+
+        mock_save.assert_not_called()
@@ -0,0 +1,294 @@
+"""Test spell checker functionality."""
+
+from collections import OrderedDict
+from unittest.mock import Mock, patch
+
+import pytest
+from PyQt5.QtGui import QTextCharFormat, QTextCursor
+from PyQt5.QtWidgets import QApplication, QTextEdit
+
+from ai_writer.core.spell_checker import (
+    SpellChecker,
+    _is_correct,
+    _SharedDictionary,
+)
+
+# Words the fake dictionary rejects
+MISSPELLED = {"badd"}
+
+
+class FakeDictionary:
+    """Stand-in for an enchant dictionary."""
+
+    def check(self, word):
+        return word not in MISSPELLED
+
+    def suggest(self, word):
+        return ["bad"]
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create QApplication instance for testing."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def checker(qapp):
+    """Create a SpellChecker on an empty editor, backed by FakeDictionary."""
+    editor = QTextEdit()
+    with patch("ai_writer.core.spell_checker.ENCHANT_AVAILABLE", True), patch(
+        "ai_writer.core.spell_checker._get_dictionary", return_value=FakeDictionary()
+    ):
+        spell_checker = SpellChecker(editor)
+        # Keep the shared lookup cache apart from real dictionaries
+        spell_checker.dictionary_tag = "test_FAKE"
+        yield spell_checker
+        spell_checker._debounce.stop()
+
+
+def run_check(checker, full=False):
+    """Run a check and deliver the worker's results."""
+    checker.check_spelling(full=full)
+    worker = checker.worker
+    if worker is not None:
+        assert worker.wait(5000)
+    QApplication.processEvents()
+    return worker
+
+
+def insert_text(checker, position, text):
+    """Insert text into the checker's document."""
+    cursor = QTextCursor(checker.text_editor.document())
+    cursor.setPosition(position)
+    cursor.insertText(text)
+
+
+def remove_text(checker, start, end):
+    """Remove a range from the checker's document."""
+    cursor = QTextCursor(checker.text_editor.document())
+    cursor.setPosition(start)
+    cursor.setPosition(end, QTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+
+
+def is_underlined(checker, position):
+    """Check whether the character at position has the misspelling underline."""
+    cursor = QTextCursor(checker.text_editor.document())
+    cursor.setPosition(position + 1)
+    underline = cursor.charFormat().underlineStyle()
+    return underline == QTextCharFormat.SpellCheckUnderline
+
+
+class TestCheckCache:
+    """Test the shared dictionary lookup cache."""
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used lookups are evicted."""
+        dictionary = Mock()
+        dictionary.check.return_value = True
+        cache = OrderedDict()
+        with patch("ai_writer.core.spell_checker.CHECK_CACHE_SIZE", 2), patch(
+            "ai_writer.core.spell_checker._CHECK_CACHE", cache
+        ):
+            for word in ("one", "two", "one", "three"):
+                assert _is_correct(dictionary, "test_FAKE", word)
+
+            assert list(cache) == [("test_FAKE", "one"), ("test_FAKE", "three")]
+            assert dictionary.check.call_count == 3
+
+
+class TestSharedDictionary:
+    """Test the dictionaries shared by all workers."""
+
+    def test_calls_are_serialized(self):
+        """Test that lookups run under the dictionary's lock."""
+        with patch("ai_writer.core.spell_checker.enchant", create=True) as mock_enchant:
+            dictionary = _SharedDictionary("test_FAKE")
+        inner = mock_enchant.Dict.return_value
+        inner.check.side_effect = lambda word: dictionary._lock.locked()
+        inner.suggest.side_effect = lambda word: [str(dictionary._lock.locked())]
+
+        assert dictionary.check("word")
+        assert dictionary.suggest("word") == ["True"]
+        assert not dictionary._lock.locked()
+
+
+class TestRangeShifting:
+    """Test that tracked positions follow edits."""
+
+    def test_misspellings_shift_on_insert_and_delete(self, checker):
+        """Test that misspellings after an edit move with the text."""
+        checker.text_editor.setPlainText("good badd good badd")
+        run_check(checker, full=True)
+        assert set(checker.misspelled_words) == {5, 15}
+
+        insert_text(checker, 0, "xx ")
+        assert set(checker.misspelled_words) == {8, 18}
+
+        remove_text(checker, 0, 3)
+        assert set(checker.misspelled_words) == {5, 15}
+
+    def test_edit_inside_misspelling_drops_it(self, checker):
+        """Test that a misspelling hit by an edit is forgotten."""
+        checker.text_editor.setPlainText("good badd good badd")
+        run_check(checker, full=True)
+
+        insert_text(checker, 6, "a")
+
+        assert set(checker.misspelled_words) == {16}
+
+    def test_dirty_range_shifts_on_insert(self, checker):
+        """Test that the pending range moves past earlier insertions."""
+        checker.text_editor.setPlainText("aaaa bbbb cccc")
+        run_check(checker, full=True)
+
+        insert_text(checker, 10, "x")
+        assert checker._dirty_range == (10, 11)
+
+        # The pending end moves from 11 to 13, then the new edit is merged in
+        insert_text(checker, 0, "yz")
+        assert checker._dirty_range == (0, 13)
+
+    def test_dirty_range_shifts_on_delete(self, checker):
+        """Test that the pending range moves back over earlier deletions."""
+        checker.text_editor.setPlainText("aaaa bbbb cccc")
+        run_check(checker, full=True)
+
+        insert_text(checker, 10, "x")
+        remove_text(checker, 0, 5)
+
+        assert checker._dirty_range == (0, 6)
+
+
+class TestParagraphRecheck:
+    """Test that edits only re-check the paragraphs they touch."""
+
+    def test_recheck_covers_only_edited_paragraph(self, checker):
+        """Test that the worker gets just the edited paragraph."""
+        checker.text_editor.setPlainText("good badd\ngood good\nbadd good")
+        run_check(checker, full=True)
+        assert set(checker.misspelled_words) == {5, 20}
+
+        insert_text(checker, 19, "x")
+        worker = run_check(checker)
+
+        assert worker.offset == 10
+        assert worker.text == "good goodx"
+        assert set(checker.misspelled_words) == {5, 21}
+
+    def test_recheck_finds_new_misspelling(self, checker):
+        """Test that a misspelling typed into a paragraph is reported."""
+        checker.text_editor.setPlainText("good good\ngood good")
+        run_check(checker, full=True)
+        assert checker.misspelled_words == {}
+
+        insert_text(checker, 15, "badd ")
+        run_check(checker)
+
+        assert set(checker.misspelled_words) == {15}
+
+
+class TestHighlights:
+    """Test that only changed underlines are applied or removed."""
+
+    def test_full_check_underlines_misspellings(self, checker):
+        """Test that a full check underlines every misspelling."""
+        checker.text_editor.setPlainText("good badd good badd")
+        run_check(checker, full=True)
+
+        assert checker._applied == {(5, 4), (15, 4)}
+        assert is_underlined(checker, 5)
+        assert is_underlined(checker, 15)
+        assert not is_underlined(checker, 0)
+
+    def test_fixed_word_loses_underline(self, checker):
+        """Test that correcting a word removes just its underline."""
+        checker.text_editor.setPlainText("good badd good badd")
+        run_check(checker, full=True)
+
+        checker.replace_word_at_position(6, "bad")
+        run_check(checker)
+
+        assert checker._applied == {(14, 4)}
+        assert not is_underlined(checker, 5)
+        assert is_underlined(checker, 14)
+
+    def test_underlines_follow_insertions(self, checker):
+        """Test that applied underlines shift with text typed before them."""
+        checker.text_editor.setPlainText("good badd\ngood good")
+        run_check(checker, full=True)
+
+        insert_text(checker, 0, "new ")
+
+        assert checker._applied == {(9, 4)}
+        assert is_underlined(checker, 9)
+
+
+class TestGetWordAtPosition:
+    """Test get_word_at_position at paragraph boundaries."""
+
+    def test_start_of_document(self, checker):
+        """Test a position at the start of the first paragraph."""
+        checker.text_editor.setPlainText("hello\nworld")
+        assert checker.get_word_at_position(0) == ("hello", 0, 5)
+
+    def test_end_of_paragraph(self, checker):
+        """Test a position just after the last letter of a paragraph."""
+        checker.text_editor.setPlainText("hello\nworld")
+        assert checker.get_word_at_position(5) == ("hello", 0, 5)
+
+    def test_start_of_next_paragraph(self, checker):
+        """Test that a word never extends back into the previous paragraph."""
+        checker.text_editor.setPlainText("hello\nworld")
+        assert checker.get_word_at_position(6) == ("world", 6, 5)
+
+    def test_end_of_document(self, checker):
+        """Test a position at the very end of the document."""
+        checker.text_editor.setPlainText("hello\nworld")
+        assert checker.get_word_at_position(11) == ("world", 6, 5)
+
+    def test_between_words(self, checker):
+        """Test a position on whitespace between two words."""
+        checker.text_editor.setPlainText("one  two")
+        assert checker.get_word_at_position(4) == ("", 4, 0)
+
+
+class TestUnchangedDocument:
+    """Test that an unchanged document is not checked again."""
+
+    def test_full_recheck_is_skipped(self, checker):
+        """Test that a full check of unchanged text starts no worker."""
+        checker.text_editor.setPlainText("good badd")
+        run_check(checker, full=True)
+
+        with patch.object(checker, "_start_worker") as mock_start:
+            checker.check_spelling(full=True)
+
+            mock_start.assert_not_called()
+        assert set(checker.misspelled_words) == {5}
+
+    def test_edit_clears_short_circuit(self, checker):
+        """Test that any edit makes the next full check run again."""
+        checker.text_editor.setPlainText("good badd")
+        run_check(checker, full=True)
+
+        insert_text(checker, 9, " good")
+        with patch.object(checker, "_start_worker") as mock_start:
+            checker.check_spelling(full=True)
+
+            mock_start.assert_called_once()
+
+    def test_dictionary_change_clears_short_circuit(self, checker):
+        """Test that the same text is re-checked for another language."""
+        checker.text_editor.setPlainText("good badd")
+        run_check(checker, full=True)
+
+        checker.dictionary_tag = "test_OTHER"
+        with patch.object(checker, "_start_worker") as mock_start:
+            checker.check_spelling(full=True)
+
+            mock_start.assert_called_once()
@@ -7,6 +7,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtTest import QTest
 from PyQt5.QtWidgets import QApplication
 
+from ai_writer.core.ollama_api import save_cached_models
 from ai_writer.ui.main_window import MainWindow
 
 
@@ -20,9 +21,11 @@ def qapp():
 
 
 @pytest.fixture
-def main_window(qapp):
+def main_window(qapp, tmp_path):
     """Create MainWindow instance for testing."""
-    with patch("ai_writer.ui.main_window.get_settings") as mock_settings:
+    with patch("ai_writer.ui.main_window.get_settings") as mock_settings, patch(
+        "ai_writer.core.ollama_api.MODELS_CACHE_PATH", tmp_path / "models.json"
+    ):
         # Mock settings to avoid loading real config
         mock_settings.return_value = Mock()
         mock_settings.return_value.ui.window_width = 1000
@@ -94,6 +97,21 @@ class TestMainWindow:
         # Generate button should now be enabled
         assert main_window.toolbar.generate_btn.isEnabled()
 
+    def test_text_change_rechecks_after_button_reset(self, main_window):
+        """Test that the generate button is re-evaluated after a reset."""
+        main_window.toolbar.set_models(["test-model"], "test-model")
+        main_window.editor.setPlainText("Some text")
+        main_window._on_text_changed()
+        assert main_window.toolbar.generate_btn.isEnabled()
+
+        # Generating disables the button without the text state changing
+        main_window.start_generation()
+        assert not main_window.toolbar.generate_btn.isEnabled()
+
+        main_window._on_text_changed()
+
+        assert main_window.toolbar.generate_btn.isEnabled()
+
     def test_character_count_updates(self, main_window):
         """Test that character count updates when text changes."""
         test_text = "Hello, world!"
@@ -107,8 +125,6 @@ class TestMainWindow:
         """Test that trying to generate without a model shows warning."""
         main_window.editor.setPlainText("Some text")
         main_window.toolbar.model_combo.clear()
-        main_window.toolbar.model_combo.addItem("Select model...")
-        main_window.toolbar.model_combo.setCurrentText("Select model...")
 
         main_window.start_generation()
 
@@ -142,13 +158,55 @@ class TestMainWindowModelOperations:
         ]
         assert combo_items == models
 
+    def test_models_reload_keeps_selection(self, main_window):
+        """Test that rescanning the same models leaves the selection alone."""
+        models = ["model1", "model2"]
+        main_window._on_models_loaded(models)
+        main_window.toolbar.model_combo.setCurrentText("model2")
+
+        main_window._on_models_loaded(list(models))
+
+        assert main_window.toolbar.current_model() == "model2"
+        assert main_window.toolbar.model_combo.count() == 2
+
     def test_models_loaded_empty(self, main_window):
         """Test handling of empty model list."""
         main_window._on_models_loaded([])
 
-        assert main_window.toolbar.model_combo.itemText(0) == "No models found"
+        assert main_window.toolbar.model_combo.count() == 0
+        assert main_window.toolbar.model_combo.placeholderText() == "No models found"
         assert not main_window.toolbar.generate_btn.isEnabled()
 
+    def test_models_loaded_are_cached(self, main_window):
+        """Test that the last scanned model list is offered before scanning."""
+        save_cached_models("http://localhost:11434", ["model1", "model2"])
+
+        main_window.scan_models()
+
+        assert main_window.toolbar.model_combo.count() == 2
+
+    def test_scan_error_keeps_stale_models(self, main_window):
+        """Test that a failed scan keeps the models already listed."""
+        main_window._on_models_loaded(["model1"])
+
+        with patch("ai_writer.ui.main_window.QMessageBox.critical") as mock_critical:
+            main_window._on_scan_error("Connection refused")
+
+            mock_critical.assert_not_called()
+        assert main_window.toolbar.model_combo.count() == 1
+
+    def test_model_warm_up_waits_for_selection_to_settle(self, main_window):
+        """Test that stepping through models only warms up the last one."""
+        with patch("ai_writer.ui.main_window.OllamaClient") as mock_client:
+            main_window._on_models_loaded(["model1", "model2"])
+            main_window.toolbar.model_combo.setCurrentText("model2")
+            main_window.toolbar.model_combo.setCurrentText("model1")
+            mock_client.warm_up_model.assert_not_called()
+
+            main_window._warmup_timer.timeout.emit()
+
+            mock_client.warm_up_model.assert_called_once_with("model1")
+
     def test_error_handling(self, main_window):
         """Test error handling."""
         with patch("ai_writer.ui.main_window.QMessageBox.critical") as mock_critical:
@@ -164,26 +222,45 @@ class TestMainWindowFileOperations:
     """Test file operation functionality."""
 
     def test_save_txt_calls_file_manager(self, main_window):
-        """Test that save TXT calls file manager."""
-        with patch.object(main_window.file_manager, "save_as_txt") as mock_save:
-            mock_save.return_value = True
+        """Test that save TXT starts a background save through the file manager."""
+        with patch.object(main_window.file_manager, "save_in_background") as mock_save:
             main_window.file_manager.current_file = "test.txt"
 
             main_window.editor.setPlainText("Test content")
             main_window._save_as_txt()
 
-            mock_save.assert_called_once_with("Test content", file_path="test.txt")
+            mock_save.assert_called_once_with("Test content", "txt", "test.txt")
+            mock_save.return_value.start.assert_called_once()
 
     def test_save_docx_calls_file_manager(self, main_window):
-        """Test that save DOCX calls file manager."""
-        with patch.object(main_window.file_manager, "save_as_docx") as mock_save:
-            mock_save.return_value = True
+        """Test that save DOCX starts a background save through the file manager."""
+        with patch.object(main_window.file_manager, "save_in_background") as mock_save:
             main_window.file_manager.current_file = "test.docx"
 
             main_window.editor.setPlainText("Test content")
             main_window._save_as_docx()
 
-            mock_save.assert_called_once_with("Test content", file_path="test.docx")
+            mock_save.assert_called_once_with("Test content", "docx", "test.docx")
+            mock_save.return_value.start.assert_called_once()
+
+
+    def test_saves_run_one_at_a_time(self, main_window):
+        """Test that a save requested while another runs waits for it."""
+        first, second = Mock(), Mock()
+        with patch.object(
+            main_window.file_manager, "save_in_background", side_effect=[first, second]
+        ):
+            main_window.editor.setPlainText("Test content")
+            main_window._save_as_txt()
+            main_window._save_as_txt()
+
+        first.start.assert_called_once()
+        second.start.assert_not_called()
+
+        main_window._on_save_finished("test.txt")
+
+        second.start.assert_called_once()
+        assert main_window.save_worker is second
 
 
 class TestMainWindowMenuBar:
@@ -0,0 +1,37 @@
+"""Test background worker support."""
+
+from ai_writer.utils.workers import BackgroundWorker, get_thread_pool
+
+
+class RecordingWorker(BackgroundWorker):
+    """Worker that records that it ran."""
+
+    def __init__(self):
+        super().__init__()
+        self.ran = False
+
+    def run(self):
+        self.ran = True
+
+
+class TestBackgroundWorker:
+    """Test BackgroundWorker class."""
+
+    def test_idle_before_start(self):
+        """Test that a new worker is not running."""
+        worker = RecordingWorker()
+        assert not worker.isRunning()
+        assert worker.wait(0)
+
+    def test_start_runs_on_pool(self):
+        """Test that starting a worker runs it on the shared pool."""
+        worker = RecordingWorker()
+        worker.start()
+
+        assert worker.wait(5000)
+        assert worker.ran
+        assert not worker.isRunning()
+
+    def test_thread_pool_is_shared(self):
+        """Test that the same pool is reused across calls."""
+        assert get_thread_pool() is get_thread_pool()